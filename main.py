@@ -9,14 +9,17 @@ Run this file to start playing!
 import sys
 import os
 
-# Add src directory to path so we can import game modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
-from enhanced_game_engine import EnhancedGameEngine
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
 
 def main():
     """Main function to start the game"""
     try:
+        # Add src directory to path and import the engine only when the game starts,
+        # so a broken engine module is reported by the handlers below
+        if SRC_DIR not in sys.path:
+            sys.path.insert(0, SRC_DIR)
+        from enhanced_game_engine import EnhancedGameEngine
+        
         # Use enhanced game engine with console interface
         game = EnhancedGameEngine(interface_type="console")
         game.run()
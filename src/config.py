@@ -4,76 +4,40 @@ Centralized settings and constants for the game
 """
 
 import os
-from typing import Dict, Any
+import sys
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Tuple
 
-class GameConfig:
-    """Central configuration for ChoiceCents game"""
-    
-    # Game Version
-    VERSION = "0.1.0-MVP"
-    TITLE = "ChoiceCents: Your Money Journey"
-    
-    # File Paths
-    BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    DATA_DIR = os.path.join(BASE_DIR, "data")
-    SAVES_DIR = os.path.join(BASE_DIR, "saves")
-    
-    # Game Balance Settings
-    STARTING_CASH = 1000.0
-    STARTING_CREDIT_SCORE = 650
-    STARTING_WELLBEING = 50
-    STARTING_AGE = 18
-    
-    # Financial Constants (Indiana-based)
-    EDUCATION_COSTS = {
-        "four_year_college": 40000,
-        "community_college": 15000,
-        "trade_school": 13000,
-        "military": 0,
-        "immediate_work": 0,
-        "entrepreneur": 5000  # startup costs
-    }
-    
-    STARTING_SALARIES = {
-        "four_year_college": 0,  # No immediate income
-        "community_college": 0,  # No immediate income
-        "trade_school": 0,       # No immediate income
-        "military": 2200,
-        "immediate_work": 2400,
-        "entrepreneur": 1500     # Variable income
-    }
-    
-    # Living Costs (Monthly, Indiana averages)
-    LIVING_COSTS = {
-        "housing_student_dorm": 900,
-        "housing_student_shared": 650,
-        "housing_young_professional": 800,
-        "housing_studio": 1000,
-        "housing_one_bedroom": 1200,
-        "housing_family_rental": 1600,
-        "food_basic": 300,
-        "food_moderate": 450,
-        "food_premium": 600,
-        "transport_public": 80,
-        "transport_bicycle": 20,      # Bike maintenance/gear
-        "transport_used_car": 250,    # Payment + insurance + gas
-        "transport_reliable_car": 400,
-        "transport_new_car": 550,
-        "utilities_basic": 120,
-        "utilities_full": 180,
-        "phone_basic": 35,
-        "phone_premium": 85,
-        "insurance_basic": 150,
-        "insurance_comprehensive": 250,
-        "entertainment_minimal": 50,
-        "entertainment_moderate": 150,
-        "entertainment_high": 300,
-        "clothing_basic": 50,
-        "clothing_professional": 100
-    }
-    
-    # Vehicle Options
-    VEHICLE_OPTIONS = {
+
+# Education path keys shared by the cost, salary and part-time job tables
+FOUR_YEAR_COLLEGE = "four_year_college"
+COMMUNITY_COLLEGE = "community_college"
+TRADE_SCHOOL = "trade_school"
+MILITARY = "military"
+IMMEDIATE_WORK = "immediate_work"
+ENTREPRENEUR = "entrepreneur"
+GAP_YEAR = "gap_year"
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def part_time_monthly_wage(job: Mapping[str, Any]) -> int:
+    """Monthly pay for a part-time job, assuming four working weeks per month"""
+    return job["hourly_wage"] * job["max_hours_per_week"] * 4
+
+
+def _build_vehicle_options() -> Mapping[str, Mapping[str, Any]]:
+    """Vehicle Options"""
+    vehicles = {
         "none": {
             "name": "No Vehicle",
             "monthly_cost": 0,
@@ -125,16 +89,123 @@ class GameConfig:
         }
     }
     
+    # Derived figures the vehicle menus would otherwise recompute on every render
+    for vehicle in vehicles.values():
+        purchase_cost = vehicle["purchase_cost"]
+        monthly_cost = vehicle["monthly_cost"]
+        vehicle["annual_cost"] = monthly_cost * 12
+        vehicle["three_year_cost"] = purchase_cost + monthly_cost * 36
+        vehicle["reliability_per_dollar"] = vehicle["reliability"] / max(purchase_cost, 1)
+        vehicle["menu_label"] = f"{vehicle['name']} - ${purchase_cost:,} (${monthly_cost:,}/month)"
+    return _freeze(vehicles)
+
+
+class GameConfig:
+    """Central configuration for ChoiceCents game"""
+    
+    __slots__ = ()
+    
+    # Game Version
+    VERSION = "0.1.0-MVP"
+    TITLE = "ChoiceCents: Your Money Journey"
+    
+    # File Paths
+    BASE_DIR = Path(__file__).resolve().parents[1]
+    DATA_DIR = BASE_DIR / "data"
+    SAVES_DIR = BASE_DIR / "saves"
+    
+    # Game Balance Settings
+    STARTING_CASH = 1000.0
+    STARTING_CREDIT_SCORE = 650
+    STARTING_WELLBEING = 50
+    STARTING_AGE = 18
+    INITIAL_COSTS_SHARE = 0.2      # Share of cash spent getting started on any path...
+    INITIAL_COSTS_CAP = 2000       # ...capped at this amount
+    
+    # Financial Constants (Indiana-based)
+    EDUCATION_COSTS = MappingProxyType({
+        FOUR_YEAR_COLLEGE: 40000,
+        COMMUNITY_COLLEGE: 15000,
+        TRADE_SCHOOL: 13000,
+        MILITARY: 0,
+        IMMEDIATE_WORK: 0,
+        ENTREPRENEUR: 5000  # startup costs
+    })
+    
+    STARTING_SALARIES = MappingProxyType({
+        FOUR_YEAR_COLLEGE: 0,  # No immediate income
+        COMMUNITY_COLLEGE: 0,  # No immediate income
+        TRADE_SCHOOL: 0,       # No immediate income
+        MILITARY: 2200,
+        IMMEDIATE_WORK: 2400,
+        ENTREPRENEUR: 1500     # Variable income
+    })
+    
+    # Living Costs (Monthly, Indiana averages)
+    LIVING_COSTS = _freeze({
+        "housing": {
+            "student_dorm": 900,
+            "student_shared": 650,
+            "young_professional": 800,
+            "studio": 1000,
+            "one_bedroom": 1200,
+            "family_rental": 1600
+        },
+        "food": {
+            "basic": 300,
+            "moderate": 450,
+            "premium": 600
+        },
+        "transport": {
+            "public": 80,
+            "bicycle": 20,      # Bike maintenance/gear
+            "used_car": 250,    # Payment + insurance + gas
+            "reliable_car": 400,
+            "new_car": 550
+        },
+        "utilities": {
+            "basic": 120,
+            "full": 180
+        },
+        "phone": {
+            "basic": 35,
+            "premium": 85
+        },
+        "insurance": {
+            "basic": 150,
+            "comprehensive": 250
+        },
+        "entertainment": {
+            "minimal": 50,
+            "moderate": 150,
+            "high": 300
+        },
+        "clothing": {
+            "basic": 50,
+            "professional": 100
+        }
+    })
+    
+    # Vehicle Options
+    VEHICLE_OPTIONS = _build_vehicle_options()
+    
     # Game Mechanics
     RANDOM_EVENT_CHANCE = 0.08    # 8% chance per month (reduced due to more content)
     MINIGAME_CHANCE = 0.12        # 12% chance per month
     CAREER_EVENT_CHANCE = 0.06    # 6% chance for career-related events
+    SKIP_EVENT_CHANCE = 0.1       # 10% chance per month while skipping time
     DEBT_INTEREST_RATE = 0.048    # 4.8% annual student loan interest
-    CREDIT_SCORE_RANGE = (300, 850)
-    WELLBEING_RANGE = (0, 100)
+    MONTHLY_DEBT_INTEREST_RATE = DEBT_INTEREST_RATE / 12
+    MONTHLY_DEBT_FACTOR = 1.0 + MONTHLY_DEBT_INTEREST_RATE  # Balance multiplier per month
+    CREDIT_SCORE_MIN = 300
+    CREDIT_SCORE_MAX = 850
+    CREDIT_SCORE_RANGE = (CREDIT_SCORE_MIN, CREDIT_SCORE_MAX)
+    WELLBEING_MIN = 0
+    WELLBEING_MAX = 100
+    WELLBEING_RANGE = (WELLBEING_MIN, WELLBEING_MAX)
     
     # Time Scaling
-    TIME_SKIP_OPTIONS = [1, 3, 6]  # Months that can be skipped at once
+    TIME_SKIP_OPTIONS = (1, 3, 6)  # Months that can be skipped at once
     AUTO_SKIP_THRESHOLD = 0.05     # If monthly change < 5%, suggest time skip
     
     # Progression Settings
@@ -148,45 +219,43 @@ class GameConfig:
     STUDY_TIME_IMPACT = 0.1                # GPA impact from part-time work
     SIMULATION_LENGTH_MONTHS = 36          # 3 year simulation
     
-    # Part-time job wages (monthly estimates for part-time work)
-    PART_TIME_JOB_WAGES = {
-        "retail": 1200,
-        "food_service": 1000,
-        "tutoring": 1500,
-        "office_assistant": 1300,
-        "campus_job": 800,
-        "freelance": 1400
-    }
-    
     # Part-time job details
-    PART_TIME_JOBS = {
+    PART_TIME_JOBS = _freeze({
         "retail": {
             "title": "Retail Sales Associate",
             "hourly_wage": 15,
             "max_hours_per_week": 20,
-            "education_compatible": ["Community College", "4-Year University", "Trade School"],
-            "skills_developed": ["customer service", "sales"]
+            "education_compatible": ["Community College", "4-Year University", "Trade School", "Gap Year"],
+            "skills_developed": ["customer service", "sales"],
+            "flexibility": "high",
+            "description": "Work in stores, flexible scheduling"
         },
         "food_service": {
             "title": "Food Service Worker",
             "hourly_wage": 12,
             "max_hours_per_week": 25,
-            "education_compatible": ["Community College", "4-Year University", "Trade School"],
-            "skills_developed": ["teamwork", "time management"]
+            "education_compatible": ["Community College", "4-Year University", "Trade School", "Gap Year"],
+            "skills_developed": ["teamwork", "time management"],
+            "flexibility": "medium",
+            "description": "Restaurant/cafeteria work, includes tips"
         },
         "tutoring": {
             "title": "Peer Tutor",
             "hourly_wage": 18,
             "max_hours_per_week": 15,
             "education_compatible": ["4-Year University"],
-            "skills_developed": ["communication", "subject expertise"]
+            "skills_developed": ["communication", "subject expertise"],
+            "flexibility": "high",
+            "description": "Help other students, great for resume"
         },
         "office_assistant": {
             "title": "Office Assistant",
             "hourly_wage": 14,
             "max_hours_per_week": 20,
             "education_compatible": ["Community College", "4-Year University"],
-            "skills_developed": ["organization", "computer skills"]
+            "skills_developed": ["organization", "computer skills"],
+            "flexibility": "medium",
+            "description": "Administrative work, office experience"
         },
         "campus_job": {
             "title": "Campus Work-Study",
@@ -199,10 +268,22 @@ class GameConfig:
             "title": "Freelance Work",
             "hourly_wage": 20,
             "max_hours_per_week": 15,
-            "education_compatible": ["Community College", "4-Year University", "Trade School"],
-            "skills_developed": ["entrepreneurship", "self-management"]
+            "education_compatible": ["Community College", "4-Year University", "Trade School", "Gap Year"],
+            "skills_developed": ["entrepreneurship", "self-management"],
+            "flexibility": "very high",
+            "description": "Writing, design, programming - build portfolio"
         }
-    }
+    })
+    
+    # Part-time job wages (monthly estimates for part-time work)
+    PART_TIME_JOB_WAGES = MappingProxyType({
+        "retail": 1200,
+        "food_service": 1000,
+        "tutoring": 1500,
+        "office_assistant": 1300,
+        "campus_job": 800,
+        "freelance": 1400
+    })
     
     # Display Settings (for future GUI)
     DISPLAY_WIDTH = 800
@@ -212,7 +293,7 @@ class GameConfig:
     FONT_SIZE_TITLE = 24
     
     # Colors (for future GUI)
-    COLORS = {
+    COLORS = MappingProxyType({
         "primary": "#2E8B57",      # Sea Green
         "secondary": "#FFD700",    # Gold
         "background": "#F5F5F5",   # White Smoke
@@ -221,104 +302,187 @@ class GameConfig:
         "warning": "#FFC107",      # Amber
         "danger": "#DC3545",       # Red
         "info": "#17A2B8"          # Cyan
-    }
+    })
     
     # Text Interface Settings (current)
     TEXT_WIDTH = 60
     SEPARATOR_CHAR = "="
+    SEPARATOR_LINE = sys.intern(SEPARATOR_CHAR * TEXT_WIDTH)
+    
+    # Save Files
+    SAVE_FILE_EXTENSION = ".json.gz"  # ".json" writes plain, human-readable saves instead
+    
+    # Set once validate_config / ensure_directories have succeeded in this process
+    _validated = False
+    _dirs_ensured = False
     
     @classmethod
+    @lru_cache(maxsize=128)
     def get_data_file_path(cls, filename: str) -> str:
         """Get the full path to a data file"""
-        return os.path.join(cls.DATA_DIR, filename)
+        return str(cls.DATA_DIR / filename)
     
     @classmethod
+    @lru_cache(maxsize=128)
     def get_save_file_path(cls, filename: str) -> str:
         """Get the full path to a save file"""
-        return os.path.join(cls.SAVES_DIR, filename)
+        return str(cls.SAVES_DIR / filename)
     
     @classmethod
     def ensure_directories(cls):
         """Ensure all required directories exist"""
-        for directory in [cls.DATA_DIR, cls.SAVES_DIR]:
-            if not os.path.exists(directory):
-                os.makedirs(directory)
+        if cls._dirs_ensured:
+            return
+        for directory in (cls.DATA_DIR, cls.SAVES_DIR):
+            os.makedirs(directory, exist_ok=True)
+        cls._dirs_ensured = True
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _range_warnings(cls) -> Tuple[str, ...]:
+        """Problems with starting values that fall outside their valid ranges"""
+        warnings = []
+        
+        low, high = cls.CREDIT_SCORE_RANGE
+        if not low <= cls.STARTING_CREDIT_SCORE <= high:
+            warnings.append("Starting credit score outside valid range")
+        
+        low, high = cls.WELLBEING_RANGE
+        if not low <= cls.STARTING_WELLBEING <= high:
+            warnings.append("Starting wellbeing score outside valid range")
+        
+        return tuple(warnings)
     
     @classmethod
     def validate_config(cls) -> bool:
         """Validate configuration settings"""
+        if cls._validated:
+            return True
+        
         try:
-            # Check critical paths exist
-            if not os.path.exists(cls.BASE_DIR):
-                print(f"Warning: Base directory not found: {cls.BASE_DIR}")
+            # Ensure directories are created (fails if the base directory is unusable)
+            try:
+                cls.ensure_directories()
+            except OSError as e:
+                print(f"Warning: Could not create game directories under {cls.BASE_DIR}: {e}")
                 return False
             
-            # Ensure directories are created
-            cls.ensure_directories()
-            
-            # Validate numeric ranges
-            if cls.STARTING_CREDIT_SCORE < cls.CREDIT_SCORE_RANGE[0] or \
-               cls.STARTING_CREDIT_SCORE > cls.CREDIT_SCORE_RANGE[1]:
-                print("Warning: Starting credit score outside valid range")
-                return False
-            
-            if cls.STARTING_WELLBEING < cls.WELLBEING_RANGE[0] or \
-               cls.STARTING_WELLBEING > cls.WELLBEING_RANGE[1]:
-                print("Warning: Starting wellbeing score outside valid range")
+            # Validate numeric ranges (pure constants, so the verdict is cached)
+            range_warnings = cls._range_warnings()
+            if range_warnings:
+                print(f"Warning: {range_warnings[0]}")
                 return False
             
+            cls._validated = True
             return True
             
         except Exception as e:
             print(f"Configuration validation error: {e}")
             return False
+    
+    @classmethod
+    def invalidate_config_cache(cls):
+        """Force the next validate_config call to re-run all checks"""
+        cls._validated = False
+        cls._dirs_ensured = False
+        cls._range_warnings.cache_clear()
+
+
+# Module-level aliases for constants read in the monthly simulation loop
+MONTHLY_DEBT_FACTOR = GameConfig.MONTHLY_DEBT_FACTOR
+CREDIT_SCORE_MIN, CREDIT_SCORE_MAX = GameConfig.CREDIT_SCORE_RANGE
+WELLBEING_MIN, WELLBEING_MAX = GameConfig.WELLBEING_RANGE
+RANDOM_EVENT_CHANCE = GameConfig.RANDOM_EVENT_CHANCE
+MINIGAME_CHANCE = GameConfig.MINIGAME_CHANCE
+SKIP_EVENT_CHANCE = GameConfig.SKIP_EVENT_CHANCE
+
+# Path helpers bound once, so callers skip classmethod binding on every call
+get_data_file_path = GameConfig.get_data_file_path
+get_save_file_path = GameConfig.get_save_file_path
+
+# Education labels differ between the path menu and the job tables, so both map to one key
+_EDUCATION_KEYS = {
+    "Four-year university (Public)": FOUR_YEAR_COLLEGE,
+    "Four-year university (Private)": FOUR_YEAR_COLLEGE,
+    "4-Year University": FOUR_YEAR_COLLEGE,
+    "Community college": COMMUNITY_COLLEGE,
+    "Community College": COMMUNITY_COLLEGE,
+    "Trade school": TRADE_SCHOOL,
+    "Trade School": TRADE_SCHOOL,
+    "Join the military": MILITARY,
+    "Military Service": MILITARY,
+    "Enter workforce immediately": IMMEDIATE_WORK,
+    "Start your own business": ENTREPRENEUR,
+    "Gap year + travel": GAP_YEAR,
+    "Gap Year": GAP_YEAR
+}
+
+# Education keys that count as being a student
+STUDENT_EDUCATIONS = frozenset((FOUR_YEAR_COLLEGE, COMMUNITY_COLLEGE, TRADE_SCHOOL))
+
+
+def education_key(label: str) -> str:
+    """Normalize an education path label to its config key"""
+    return _EDUCATION_KEYS.get(label, label)
+
+
+def _index_jobs_by_education(jobs: Mapping[str, Mapping[str, Any]]) -> Dict[str, Tuple[str, ...]]:
+    """Build an education key -> compatible part-time job ids index, in table order"""
+    keys = {education_key(label) for job in jobs.values() for label in job.get("education_compatible", ())}
+    return {
+        key: tuple(job_id for job_id, job in jobs.items()
+                   if not job.get("education_compatible")
+                   or any(education_key(label) == key for label in job["education_compatible"]))
+        for key in keys
+    }
+
+
+PART_TIME_JOBS_BY_EDUCATION = _index_jobs_by_education(GameConfig.PART_TIME_JOBS)
+
+# Jobs without an education requirement, the only ones open to paths no job lists
+PART_TIME_JOBS_ANY_EDUCATION = tuple(
+    job_id for job_id, job in GameConfig.PART_TIME_JOBS.items() if not job.get("education_compatible")
+)
+
+
+class EducationPath(NamedTuple):
+    """A post-graduation path offered in Chapter 1"""
+    name: str
+    description: str
+    debt: int
+    time_years: float
+    immediate_income: int
+    allows_part_time: bool
+    gpa_requirement: Optional[float]
+    startup_cost: int = 0
 
 
 # Game Text Constants
 class GameText:
     """Text constants for the game interface"""
     
-    WELCOME_MESSAGE = f"""
-{GameConfig.SEPARATOR_CHAR * GameConfig.TEXT_WIDTH}
-    {GameConfig.TITLE}
-    A Personal Finance Adventure Game
-{GameConfig.SEPARATOR_CHAR * GameConfig.TEXT_WIDTH}
-
-Welcome to ChoiceCents! In this game, you'll make
-financial decisions that will shape your life journey.
-Learn about budgeting, saving, investing, and more
-as you navigate from high school graduation to retirement.
-
-Your choices matter - let's begin your money journey!
-"""
+    __slots__ = ()
+    
+    # Banner separator, built once from the display settings
+    _SEP = GameConfig.SEPARATOR_LINE
     
-    MAIN_MENU = """
-========================================
+    MAIN_MENU = f"""
+{_SEP}
 MAIN MENU
-========================================
+{_SEP}
 1. New Game
 2. Load Game
 3. About
 4. Quit
 """
     
-    CHARACTER_CREATION_HEADER = """
-========================================
+    CHARACTER_CREATION_HEADER = f"""
+{_SEP}
 CHARACTER CREATION
-========================================
+{_SEP}
 """
     
-    CHAPTER_1_INTRO = """
-==================================================
-CHAPTER 1: GRADUATION DAY
-==================================================
-
-Congratulations! You've graduated high school.
-Now you need to decide what to do next.
-Each path has different costs, benefits, and opportunities.
-"""
-    
-    LIFE_GOALS_OPTIONS = [
+    LIFE_GOALS_OPTIONS = (
         "Buy a reliable car",
         "Get a college degree", 
         "Buy a house",
@@ -334,117 +498,90 @@ Each path has different costs, benefits, and opportunities.
         "Start a charitable foundation",
         "Live debt-free lifestyle",
         "Build a diversified investment portfolio"
-    ]
-    
-    EDUCATION_PATHS = {
-        "1": {
-            "name": "Four-year university (Public)",
-            "description": "Bachelor's degree at state university - good ROI",
-            "debt": 35000,
-            "time_years": 4,
-            "immediate_income": 0,
-            "allows_part_time": True,
-            "gpa_requirement": 2.0
-        },
-        "2": {
-            "name": "Four-year university (Private)",
-            "description": "Bachelor's degree at private college - premium education",
-            "debt": 60000,
-            "time_years": 4,
-            "immediate_income": 0,
-            "allows_part_time": True,
-            "gpa_requirement": 2.5
-        },
-        "3": {
-            "name": "Community college",
-            "description": "Associate degree - affordable and practical",
-            "debt": 8000,
-            "time_years": 2,
-            "immediate_income": 0,
-            "allows_part_time": True,
-            "gpa_requirement": 2.0
-        },
-        "4": {
-            "name": "Trade school",
-            "description": "Specialized skills training - fast track to employment",
-            "debt": 15000,
-            "time_years": 1.5,
-            "immediate_income": 0,
-            "allows_part_time": False,  # Too intensive
-            "gpa_requirement": None
-        },
-        "5": {
-            "name": "Enter workforce immediately",
-            "description": "Start earning right away, no debt, but limited growth",
-            "debt": 0,
-            "time_years": 0,
-            "immediate_income": GameConfig.STARTING_SALARIES["immediate_work"],
-            "allows_part_time": False,
-            "gpa_requirement": None
-        },
-        "6": {
-            "name": "Join the military",
-            "description": "Steady pay, benefits, and education opportunities",
-            "debt": 0,
-            "time_years": 4,
-            "immediate_income": GameConfig.STARTING_SALARIES["military"],
-            "allows_part_time": False,
-            "gpa_requirement": None
-        },
-        "7": {
-            "name": "Start your own business",
-            "description": "High risk, high reward, unlimited potential",
-            "debt": 0,
-            "startup_cost": GameConfig.EDUCATION_COSTS["entrepreneur"],
-            "immediate_income": GameConfig.STARTING_SALARIES["entrepreneur"],
-            "allows_part_time": False,
-            "gpa_requirement": None
-        },
-        "8": {
-            "name": "Gap year + travel",
-            "description": "Take a year to explore, work, and figure out your path",
-            "debt": 0,
-            "time_years": 1,
-            "immediate_income": 1800,  # Part-time/seasonal work
-            "allows_part_time": True,
-            "gpa_requirement": None
-        }
-    }
+    )
     
-    # Part-time Job Options (available during education)
-    PART_TIME_JOBS = {
-        "retail": {
-            "name": "Retail Associate",
-            "hourly_wage": 12,
-            "hours_per_week": 20,
-            "flexibility": "high",
-            "skill_building": "customer service",
-            "description": "Work in stores, flexible scheduling"
-        },
-        "food_service": {
-            "name": "Food Service Worker",
-            "hourly_wage": 11,
-            "hours_per_week": 25,
-            "flexibility": "medium",
-            "skill_building": "teamwork",
-            "description": "Restaurant/cafeteria work, includes tips"
-        },
-        "tutor": {
-            "name": "Tutor",
-            "hourly_wage": 18,
-            "hours_per_week": 15,
-            "flexibility": "high",
-            "skill_building": "communication",
-            "description": "Help other students, great for resume"
-        },
-        "office_assistant": {
-            "name": "Office Assistant",
-            "hourly_wage": 15,
-            "hours_per_week": 20,
-            "flexibility": "medium",
-            "skill_building": "professional skills",
-            "description": "Administrative work, office experience"
-        },
+    # Menu option N maps to EDUCATION_PATHS[N - 1]
+    EDUCATION_PATHS: Tuple[EducationPath, ...] = (
+        EducationPath(
+            name="Four-year university (Public)",
+            description="Bachelor's degree at state university - good ROI",
+            debt=35000,
+            time_years=4,
+            immediate_income=0,
+            allows_part_time=True,
+            gpa_requirement=2.0
+        ),
+        EducationPath(
+            name="Four-year university (Private)",
+            description="Bachelor's degree at private college - premium education",
+            debt=60000,
+            time_years=4,
+            immediate_income=0,
+            allows_part_time=True,
+            gpa_requirement=2.5
+        ),
+        EducationPath(
+            name="Community college",
+            description="Associate degree - affordable and practical",
+            debt=8000,
+            time_years=2,
+            immediate_income=0,
+            allows_part_time=True,
+            gpa_requirement=2.0
+        ),
+        EducationPath(
+            name="Trade school",
+            description="Specialized skills training - fast track to employment",
+            debt=15000,
+            time_years=1.5,
+            immediate_income=0,
+            allows_part_time=False,  # Too intensive
+            gpa_requirement=None
+        ),
+        EducationPath(
+            name="Enter workforce immediately",
+            description="Start earning right away, no debt, but limited growth",
+            debt=0,
+            time_years=0,
+            immediate_income=GameConfig.STARTING_SALARIES[IMMEDIATE_WORK],
+            allows_part_time=False,
+            gpa_requirement=None
+        ),
+        EducationPath(
+            name="Join the military",
+            description="Steady pay, benefits, and education opportunities",
+            debt=0,
+            time_years=4,
+            immediate_income=GameConfig.STARTING_SALARIES[MILITARY],
+            allows_part_time=False,
+            gpa_requirement=None
+        ),
+        EducationPath(
+            name="Start your own business",
+            description="High risk, high reward, unlimited potential",
+            debt=0,
+            time_years=0,
+            immediate_income=GameConfig.STARTING_SALARIES[ENTREPRENEUR],
+            allows_part_time=False,
+            gpa_requirement=None,
+            startup_cost=GameConfig.EDUCATION_COSTS[ENTREPRENEUR]
+        ),
+        EducationPath(
+            name="Gap year + travel",
+            description="Take a year to explore, work, and figure out your path",
+            debt=0,
+            time_years=1,
+            immediate_income=1800,  # Part-time/seasonal work
+            allows_part_time=True,
+            gpa_requirement=None
+        ),
+    )
+    
+    # Interned menu keys ("1".."N") accepted when choosing a path
+    EDUCATION_PATH_CHOICES = tuple(sys.intern(str(number)) for number in range(1, len(EDUCATION_PATHS) + 1))
+    
+    # Listed for the player but not offered during education
+    _LISTED_ONLY_PART_TIME_JOBS = _freeze({
         "delivery": {
             "name": "Delivery Driver",
             "hourly_wage": 14,
@@ -452,120 +589,219 @@ Each path has different costs, benefits, and opportunities.
             "flexibility": "high",
             "skill_building": "time management",
             "description": "Food/package delivery, need reliable vehicle"
-        },
-        "freelance": {
-            "name": "Freelance Work",
-            "hourly_wage": 22,
-            "hours_per_week": 12,
-            "flexibility": "very high",
-            "skill_building": "entrepreneurship",
-            "description": "Writing, design, programming - build portfolio"
         }
-    }
+    })
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    def part_time_jobs(cls) -> Mapping[str, Mapping[str, Any]]:
+        """Part-time Job Options (available during education), as shown to the player"""
+        views = {
+            job_id: {
+                "name": job["title"],
+                "hourly_wage": job["hourly_wage"],
+                "hours_per_week": job["max_hours_per_week"],
+                "flexibility": job.get("flexibility"),
+                "skill_building": job["skills_developed"][0],
+                "description": job.get("description")
+            }
+            for job_id, job in GameConfig.PART_TIME_JOBS.items()
+        }
+        views.update(cls._LISTED_ONLY_PART_TIME_JOBS)
+        return _freeze(views)
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    def welcome_message(cls) -> str:
+        """Welcome banner, built on first use"""
+        return f"""
+{cls._SEP}
+    {GameConfig.TITLE}
+    A Personal Finance Adventure Game
+{cls._SEP}
+
+Welcome to ChoiceCents! In this game, you'll make
+financial decisions that will shape your life journey.
+Learn about budgeting, saving, investing, and more
+as you navigate from high school graduation to retirement.
+
+Your choices matter - let's begin your money journey!
+"""
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    def chapter_1_intro(cls) -> str:
+        """Chapter 1 introduction, built on first use"""
+        return f"""
+{cls._SEP}
+CHAPTER 1: GRADUATION DAY
+{cls._SEP}
+
+Congratulations! You've graduated high school.
+Now you need to decide what to do next.
+Each path has different costs, benefits, and opportunities.
+"""
+
+
+# Education paths by the name stored in GameState.education_path
+EDUCATION_PATHS_BY_NAME: Mapping[str, EducationPath] = MappingProxyType({
+    path.name: path for path in GameText.EDUCATION_PATHS
+})
+
+# Education keys whose path leaves time for a part-time job
+PART_TIME_EDUCATIONS = frozenset(
+    education_key(path.name) for path in GameText.EDUCATION_PATHS if path.allows_part_time
+)
+
+
+def part_time_jobs_for(education_path: str) -> Tuple[str, ...]:
+    """Ids of the part-time jobs offered on an education path, in table order"""
+    key = education_key(education_path)
+    if key not in PART_TIME_EDUCATIONS:
+        return ()
+    return PART_TIME_JOBS_BY_EDUCATION.get(key, PART_TIME_JOBS_ANY_EDUCATION)
+
+
+# Achievement condition -> predicate over GameState; conditions without an entry are not yet tracked
+ACHIEVEMENT_CHECKS: Mapping[str, Callable[[Any], bool]] = MappingProxyType({
+    "monthly_income > 0": lambda state: state.monthly_income > 0,
+    "savings_account >= 1000": lambda state: state.savings_account >= 1000,
+    "education_debt <= 0": lambda state: state.education_debt <= 0,
+    "sum(investments.values()) > 0": lambda state: sum(state.investments.values()) > 0,
+    "credit_score >= 750": lambda state: state.credit_score >= 750,
+    "get_net_worth() > 0": lambda state: state.get_net_worth() > 0,
+    "has_part_time_job and is_student": lambda state: (
+        state.part_time_job is not None and education_key(state.education_path) in STUDENT_EDUCATIONS
+    ),
+    # Six months of living costs; savings contributions and debt payments are not expenses to cover
+    "savings_account >= monthly_expenses * 6": lambda state: 0 < state.monthly_living_expenses * 6 <= state.savings_account,
+    "len([v for v in investments.values() if v > 0]) >= 3": lambda state: sum(1 for value in state.investments.values() if value > 0) >= 3,
+    "credit_score >= 800": lambda state: state.credit_score >= 800,
+    "get_net_worth() >= 10000": lambda state: state.get_net_worth() >= 10000,
+    "get_net_worth() >= 50000": lambda state: state.get_net_worth() >= 50000,
+    "owns_vehicle and vehicle_type != 'none'": lambda state: state.vehicle not in (None, "none")
+})
+
+
+class Achievement(NamedTuple):
+    """An achievement and the rule that unlocks it"""
+    name: str
+    description: str
+    condition: str
+    reward_wellbeing: int
+    
+    @property
+    def check(self) -> Optional[Callable[[Any], bool]]:
+        """Predicate for this achievement's condition, or None if it is not tracked yet"""
+        return ACHIEVEMENT_CHECKS.get(self.condition)
 
 
 # Achievement System (for gamification)
 class Achievements:
     """Achievement definitions for the game"""
     
-    ACHIEVEMENT_LIST = {
-        "first_dollar": {
-            "name": "First Dollar Earned",
-            "description": "Earn your first paycheck",
-            "condition": "monthly_income > 0",
-            "reward_wellbeing": 5
-        },
-        "part_time_worker": {
-            "name": "Juggling Act",
-            "description": "Successfully balance work and studies",
-            "condition": "has_part_time_job and is_student",
-            "reward_wellbeing": 8
-        },
-        "emergency_fund_starter": {
-            "name": "Emergency Cushion",
-            "description": "Save $1,000 in emergency fund",
-            "condition": "savings_account >= 1000",
-            "reward_wellbeing": 10
-        },
-        "emergency_fund_master": {
-            "name": "Prepared for Anything",
-            "description": "Save 6 months of expenses",
-            "condition": "savings_account >= monthly_expenses * 6",
-            "reward_wellbeing": 20
-        },
-        "debt_free": {
-            "name": "Debt Free",
-            "description": "Pay off all your debt",
-            "condition": "education_debt <= 0",
-            "reward_wellbeing": 15
-        },
-        "investor": {
-            "name": "Future Investor",
-            "description": "Make your first investment",
-            "condition": "sum(investments.values()) > 0",
-            "reward_wellbeing": 8
-        },
-        "diversified_investor": {
-            "name": "Portfolio Builder",
-            "description": "Invest in 3+ different asset types",
-            "condition": "len([v for v in investments.values() if v > 0]) >= 3",
-            "reward_wellbeing": 15
-        },
-        "high_credit": {
-            "name": "Credit Master",
-            "description": "Achieve a credit score over 750",
-            "condition": "credit_score >= 750",
-            "reward_wellbeing": 12
-        },
-        "excellent_credit": {
-            "name": "Credit Superstar",
-            "description": "Achieve a credit score over 800",
-            "condition": "credit_score >= 800",
-            "reward_wellbeing": 18
-        },
-        "net_worth_positive": {
-            "name": "Positive Net Worth",
-            "description": "Achieve positive net worth",
-            "condition": "get_net_worth() > 0",
-            "reward_wellbeing": 10
-        },
-        "net_worth_10k": {
-            "name": "Building Wealth",
-            "description": "Reach $10,000 net worth",
-            "condition": "get_net_worth() >= 10000",
-            "reward_wellbeing": 15
-        },
-        "net_worth_50k": {
-            "name": "Wealth Accumulator",
-            "description": "Reach $50,000 net worth",
-            "condition": "get_net_worth() >= 50000",
-            "reward_wellbeing": 25
-        },
-        "car_owner": {
-            "name": "Mobile Independence",
-            "description": "Purchase your first car",
-            "condition": "owns_vehicle and vehicle_type != 'none'",
-            "reward_wellbeing": 12
-        },
-        "smart_shopper": {
-            "name": "Value Hunter",
-            "description": "Complete 5 comparison shopping challenges",
-            "condition": "comparison_shopping_wins >= 5",
-            "reward_wellbeing": 10
-        },
-        "budget_master": {
-            "name": "Budget Master",
-            "description": "Stay within budget for 6 consecutive months",
-            "condition": "consecutive_budget_months >= 6",
-            "reward_wellbeing": 18
-        },
-        "side_hustler": {
-            "name": "Side Hustler",
-            "description": "Earn money from multiple income sources",
-            "condition": "income_sources >= 2",
-            "reward_wellbeing": 12
-        }
-    }
+    __slots__ = ()
+    
+    # Achievements with a check are evaluated by the engine each month;
+    # the rest are defined ahead of the game systems that will award them
+    ACHIEVEMENT_LIST: Mapping[str, Achievement] = MappingProxyType({
+        "first_dollar": Achievement(
+            name="First Dollar Earned",
+            description="Earn your first paycheck",
+            condition="monthly_income > 0",
+            reward_wellbeing=5
+        ),
+        "part_time_worker": Achievement(
+            name="Juggling Act",
+            description="Successfully balance work and studies",
+            condition="has_part_time_job and is_student",
+            reward_wellbeing=8
+        ),
+        "emergency_fund_starter": Achievement(
+            name="Emergency Cushion",
+            description="Save $1,000 in emergency fund",
+            condition="savings_account >= 1000",
+            reward_wellbeing=10
+        ),
+        "emergency_fund_master": Achievement(
+            name="Prepared for Anything",
+            description="Save 6 months of expenses",
+            condition="savings_account >= monthly_expenses * 6",
+            reward_wellbeing=20
+        ),
+        "debt_free": Achievement(
+            name="Debt Free",
+            description="Pay off all your debt",
+            condition="education_debt <= 0",
+            reward_wellbeing=15
+        ),
+        "investor": Achievement(
+            name="Future Investor",
+            description="Make your first investment",
+            condition="sum(investments.values()) > 0",
+            reward_wellbeing=8
+        ),
+        "diversified_investor": Achievement(
+            name="Portfolio Builder",
+            description="Invest in 3+ different asset types",
+            condition="len([v for v in investments.values() if v > 0]) >= 3",
+            reward_wellbeing=15
+        ),
+        "high_credit": Achievement(
+            name="Credit Master",
+            description="Achieve a credit score over 750",
+            condition="credit_score >= 750",
+            reward_wellbeing=12
+        ),
+        "excellent_credit": Achievement(
+            name="Credit Superstar",
+            description="Achieve a credit score over 800",
+            condition="credit_score >= 800",
+            reward_wellbeing=18
+        ),
+        "net_worth_positive": Achievement(
+            name="Positive Net Worth",
+            description="Achieve positive net worth",
+            condition="get_net_worth() > 0",
+            reward_wellbeing=10
+        ),
+        "net_worth_10k": Achievement(
+            name="Building Wealth",
+            description="Reach $10,000 net worth",
+            condition="get_net_worth() >= 10000",
+            reward_wellbeing=15
+        ),
+        "net_worth_50k": Achievement(
+            name="Wealth Accumulator",
+            description="Reach $50,000 net worth",
+            condition="get_net_worth() >= 50000",
+            reward_wellbeing=25
+        ),
+        "car_owner": Achievement(
+            name="Mobile Independence",
+            description="Purchase your first car",
+            condition="owns_vehicle and vehicle_type != 'none'",
+            reward_wellbeing=12
+        ),
+        "smart_shopper": Achievement(
+            name="Value Hunter",
+            description="Complete 5 comparison shopping challenges",
+            condition="comparison_shopping_wins >= 5",
+            reward_wellbeing=10
+        ),
+        "budget_master": Achievement(
+            name="Budget Master",
+            description="Stay within budget for 6 consecutive months",
+            condition="consecutive_budget_months >= 6",
+            reward_wellbeing=18
+        ),
+        "side_hustler": Achievement(
+            name="Side Hustler",
+            description="Earn money from multiple income sources",
+            condition="income_sources >= 2",
+            reward_wellbeing=12
+        )
+    })
 
 
 if __name__ == "__main__":
@@ -575,4 +811,4 @@ if __name__ == "__main__":
     print(f"Configuration Valid: {GameConfig.validate_config()}")
     
     # Display some sample text
-    print(GameText.WELCOME_MESSAGE)
\ No newline at end of file
+    print(GameText.welcome_message())
\ No newline at end of file
@@ -3,20 +3,239 @@ Enhanced Game Engine for ChoiceCents
 Uses configuration and UI abstraction for better maintainability
 """
 
-import json
 import os
 import random
-from datetime import datetime
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from operator import attrgetter
+from time import localtime, strftime
+from typing import Dict, Any, List, NamedTuple, Optional, Set, Tuple
 
-from config import GameConfig, GameText, Achievements
+from config import (
+    GameConfig, GameText, Achievements,
+    COMMUNITY_COLLEGE, FOUR_YEAR_COLLEGE, MILITARY, TRADE_SCHOOL,
+    CREDIT_SCORE_MAX, CREDIT_SCORE_MIN, EDUCATION_PATHS_BY_NAME, MINIGAME_CHANCE, MONTHLY_DEBT_FACTOR,
+    RANDOM_EVENT_CHANCE, SKIP_EVENT_CHANCE, STUDENT_EDUCATIONS,
+    WELLBEING_MAX, WELLBEING_MIN, education_key, get_data_file_path, get_save_file_path, part_time_jobs_for,
+    part_time_monthly_wage
+)
+from json_files import JSON_FILE_ERRORS, SAVE_FILE_EXTENSIONS, read_json_file, write_json_file
 from ui_interface import create_interface, UserInterface
-from minigames import ComparisonShoppingGame, BudgetAllocationGame, InvestmentSimulationGame, get_random_minigame
+
+
+# Bound method of the shared generator, so random.seed() still controls every draw
+_random = random.random
+
+# Career category in expanded_content.json for each education key
+_EDUCATION_TO_CAREER = {
+    FOUR_YEAR_COLLEGE: "bachelor_degree",
+    COMMUNITY_COLLEGE: "associate_degree",
+    TRADE_SCHOOL: "trade_school",
+    MILITARY: "military_specializations"
+}
+
+# Menu labels for GameConfig.TIME_SKIP_OPTIONS, in the same order
+_TIME_SKIP_LABELS = (
+    "Continue month by month",
+    "Skip ahead 3 months (quick progress)",
+    "Skip ahead 6 months (fast progress)"
+)
+
+class _BasicEvent(NamedTuple):
+    """Fallback life event used when expanded content is unavailable"""
+    name: str
+    description: str
+    cost: int       # Negative values are gains
+    wellbeing: int
+
+
+_BASIC_EVENTS = (
+    _BasicEvent("Car Repair", "Your car needs $500 in repairs.", 500, -5),
+    _BasicEvent("Work Bonus", "Great job! You got a $300 bonus.", -300, 10),
+    _BasicEvent("Medical Bill", "Doctor visit cost $200.", 200, -3),
+    _BasicEvent("Tax Refund", "You got a $400 tax refund!", -400, 5),
+)
+
+# 1-based menu numbers accepted by select_life_goals
+_VALID_GOAL_NUMBERS = frozenset(range(1, len(GameText.LIFE_GOALS_OPTIONS) + 1))
+
+# (id, predicate) for every achievement the state can be checked against, resolved once at import
+_CHECKED_ACHIEVEMENTS = tuple(
+    (achievement_id, achievement.check)
+    for achievement_id, achievement in Achievements.ACHIEVEMENT_LIST.items()
+    if achievement.check is not None
+)
+
+
+@lru_cache(maxsize=1)
+def load_expanded_content() -> Dict[str, Any]:
+    """Parse data/expanded_content.json once; callers must treat the result as read-only"""
+    return read_json_file(get_data_file_path('expanded_content.json'))
+
+
+@lru_cache(maxsize=1)
+def expanded_content_or_none() -> Optional[Dict[str, Any]]:
+    """Expanded content, or None if the file is missing or unreadable; checked once per session"""
+    try:
+        return load_expanded_content()
+    except JSON_FILE_ERRORS:
+        return None
+
+
+# Life event categories in expanded_content.json
+_LIFE_EVENT_CATEGORIES = ("positive_events", "negative_events", "neutral_events")
+
+# Bit for each event condition the game can evaluate; other conditions never block an event
+EVENT_CONDITION_BITS = {
+    "has_income": 1 << 0,
+    "owns_car": 1 << 1,
+    "has_job": 1 << 2,
+    "is_student": 1 << 3,
+    "has_credit_card": 1 << 4,
+    "rents_apartment": 1 << 5
+}
+
+
+# Event effects given as [low, high] ranges in expanded_content.json
+_EVENT_RANGE_KEYS = ("cash_impact", "wellbeing_impact", "debt_reduction", "credit_score_impact", "salary_increase")
+
+
+def _is_event_range(value: Any) -> bool:
+    """Whether value is a [low, high] pair of numbers"""
+    return (isinstance(value, (list, tuple)) and len(value) == 2
+            and all(isinstance(bound, (int, float)) and not isinstance(bound, bool) for bound in value))
+
+
+def _normalize_event_ranges(event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Copy of an event with every effect range as an ordered (low, high) tuple, None if a range is malformed"""
+    normalized = dict(event)
+    for key in _EVENT_RANGE_KEYS:
+        if key in normalized:
+            if not _is_event_range(normalized[key]):
+                return None
+            low, high = sorted(normalized[key])
+            normalized[key] = (low, high)
+    return normalized
+
+
+def _required_condition_mask(event: Dict[str, Any]) -> int:
+    """Bitmask of the evaluable conditions an event requires"""
+    mask = 0
+    for condition in event.get("conditions", ()):
+        mask |= EVENT_CONDITION_BITS.get(condition, 0)
+    return mask
+
+
+@lru_cache(maxsize=1)
+def life_event_pools() -> Dict[str, Tuple[Tuple[int, Dict[str, Any]], ...]]:
+    """(required mask, event) pairs per category, empty if the content file is missing or invalid"""
+    content = expanded_content_or_none()
+    life_events = content.get("life_events", {}) if content is not None else {}
+    pools = {}
+    for category in _LIFE_EVENT_CATEGORIES:
+        # Events with malformed effect ranges are left out rather than failing mid-game
+        normalized = (_normalize_event_ranges(event) for event in life_events.get(category, ()))
+        pools[category] = tuple((_required_condition_mask(event), event)
+                                for event in normalized if event is not None)
+    return pools
+
+
+class AliasTable:
+    """Weighted random choice in O(1) per draw using Vose's alias method"""
+    
+    __slots__ = ("items", "_probability", "_alias")
+    
+    def __init__(self, items, weights):
+        self.items = tuple(items)
+        count = len(self.items)
+        total = float(sum(weights))
+        scaled = [weight * count / total for weight in weights]
+        self._probability = [1.0] * count
+        self._alias = list(range(count))
+        
+        small = [i for i, weight in enumerate(scaled) if weight < 1.0]
+        large = [i for i, weight in enumerate(scaled) if weight >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self._probability[less] = scaled[less]
+            self._alias[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            (small if scaled[more] < 1.0 else large).append(more)
+    
+    def __len__(self) -> int:
+        return len(self.items)
+    
+    def sample(self):
+        """Draw one item with probability proportional to its weight"""
+        # One draw picks the column (integer part) and the coin flip (fractional part)
+        draw = _random() * len(self.items)
+        column = int(draw)
+        if draw - column >= self._probability[column]:
+            column = self._alias[column]
+        return self.items[column]
+
+
+# 40% positive, 40% negative, 20% neutral
+_EVENT_CATEGORY_TABLE = AliasTable(_LIFE_EVENT_CATEGORIES, (0.4, 0.4, 0.2))
+
+
+@lru_cache(maxsize=None)
+def available_life_events(category: str, player_mask: int) -> AliasTable:
+    """Uniform sampler over a category's events that player_mask qualifies for"""
+    events = [event for required, event in life_event_pools()[category] if not required & ~player_mask]
+    return AliasTable(events, [1.0] * len(events))
+
+
+def _random_int(low: int, high: int) -> int:
+    """Uniform integer in [low, high] from a single random() draw, without randint's argument checks"""
+    return low + int(_random() * (high - low + 1))
+
+
+def simulate_passive_months(balance: float, monthly_change: float, months: int,
+                            factor: float = 1.0) -> float:
+    """Closed-form result of applying `balance = balance * factor + monthly_change` for N months"""
+    if factor == 1.0:
+        return balance + monthly_change * months
+    growth = factor ** months
+    return balance * growth + monthly_change * (growth - 1) / (factor - 1)
+
+
+# random.binomialvariate samples the count directly (Python 3.12+). It consumes the
+# generator differently, so seeded runs diverge between 3.11 and 3.12
+_binomialvariate = getattr(random, "binomialvariate", None)
+
+
+def count_successes(trials: int, chance: float) -> int:
+    """Number of successes in `trials` independent rolls that each succeed with `chance`"""
+    if _binomialvariate is not None:
+        return _binomialvariate(trials, chance)
+    return sum(_random() < chance for _ in range(trials))
 
 
 class GameState:
     """Enhanced game state management"""
     
+    __slots__ = (
+        "player_name", "player_age", "current_chapter", "game_month",
+        "cash", "monthly_income", "monthly_expenses", "_expense_total",
+        "_housing_cost", "_food_cost",
+        "education_path", "career", "education_debt", "credit_score",
+        "savings_account", "investments", "_investment_total",
+        "life_goals", "wellbeing_score", "goals_completed", "achievements_earned", "_earned_set",
+        "vehicle", "vehicle_condition", "part_time_job", "debt", "career_started",
+        "save_date", "total_playtime"
+    )
+    
+    # Category keys for the expense and investment tables, all starting at zero
+    _EXPENSE_KEYS = (
+        "housing", "food", "transportation", "entertainment", "savings",
+        "debt_payments", "taxes", "insurance", "other"
+    )
+    _INVESTMENT_KEYS = ("stocks", "bonds", "index_funds", "retirement_401k")
+    
+    # Underscore-prefixed slots are derived caches and are rebuilt on load
+    _SAVE_FIELDS = tuple(field for field in __slots__ if not field.startswith("_"))
+    _read_save_fields = attrgetter(*_SAVE_FIELDS)
+    
     def __init__(self):
         # Initialize with configuration defaults
         self.player_name: str = ""
@@ -27,17 +246,10 @@ class GameState:
         # Financial State
         self.cash: float = GameConfig.STARTING_CASH
         self.monthly_income: float = 0.0
-        self.monthly_expenses: Dict[str, float] = {
-            "housing": 0.0,
-            "food": 0.0,
-            "transportation": 0.0,
-            "entertainment": 0.0,
-            "savings": 0.0,
-            "debt_payments": 0.0,
-            "taxes": 0.0,
-            "insurance": 0.0,
-            "other": 0.0
-        }
+        self.monthly_expenses: Dict[str, float] = dict.fromkeys(self._EXPENSE_KEYS, 0.0)
+        self._expense_total: float = 0.0  # Running sum of monthly_expenses
+        self._housing_cost: float = 0.0   # Set by refresh_living_costs once the path is known
+        self._food_cost: float = 0.0
         
         # Career and Education
         self.education_path: str = ""
@@ -47,18 +259,15 @@ class GameState:
         
         # Assets and Investments
         self.savings_account: float = 0.0
-        self.investments: Dict[str, float] = {
-            "stocks": 0.0,
-            "bonds": 0.0,
-            "index_funds": 0.0,
-            "retirement_401k": 0.0
-        }
+        self.investments: Dict[str, float] = dict.fromkeys(self._INVESTMENT_KEYS, 0.0)
+        self._investment_total: float = 0.0  # Running sum of investments
         
         # Life Goals and Well-being
         self.life_goals: List[str] = []
         self.wellbeing_score: int = GameConfig.STARTING_WELLBEING
         self.goals_completed: List[str] = []
         self.achievements_earned: List[str] = []
+        self._earned_set: Set[str] = set()  # Membership view of achievements_earned
         
         # Enhanced features for Phase 2
         self.vehicle: Optional[str] = None
@@ -73,90 +282,110 @@ class GameState:
         
     def get_net_worth(self) -> float:
         """Calculate total net worth"""
-        assets = (self.cash + self.savings_account + 
-                 sum(self.investments.values()))
+        assets = self.cash + self.savings_account + self._investment_total
         debts = self.education_debt
         return assets - debts
     
     def get_monthly_cash_flow(self) -> float:
         """Calculate monthly cash flow"""
-        total_expenses = sum(self.monthly_expenses.values())
-        return self.monthly_income - total_expenses
+        return self.monthly_income - self._expense_total
+    
+    def set_expense(self, category: str, amount: float):
+        """Set one monthly expense category, keeping the running total in step"""
+        self._expense_total += amount - self.monthly_expenses.get(category, 0.0)
+        self.monthly_expenses[category] = amount
+    
+    def set_expenses(self, amounts: Dict[str, float]):
+        """Set several monthly expense categories with a single total update"""
+        expenses = self.monthly_expenses
+        delta = 0.0
+        for category, amount in amounts.items():
+            delta += amount - expenses.get(category, 0.0)
+        expenses.update(amounts)
+        self._expense_total += delta
+    
+    def add_expense(self, category: str, amount: float):
+        """Adjust one monthly expense category by a (possibly negative) amount"""
+        self.monthly_expenses[category] = self.monthly_expenses.get(category, 0.0) + amount
+        self._expense_total += amount
+    
+    def add_investment(self, kind: str, amount: float):
+        """Adjust one investment balance by a (possibly negative) amount"""
+        self.investments[kind] = self.investments.get(kind, 0.0) + amount
+        self._investment_total += amount
+    
+    @property
+    def monthly_living_expenses(self) -> float:
+        """Monthly expenses other than savings contributions and debt payments"""
+        expenses = self.monthly_expenses
+        return self._expense_total - expenses.get("savings", 0.0) - expenses.get("debt_payments", 0.0)
+    
+    @property
+    def housing_cost(self) -> float:
+        """Monthly housing cost for the current education path"""
+        return self._housing_cost
+    
+    @property
+    def food_cost(self) -> float:
+        """Monthly food cost for the current education path"""
+        return self._food_cost
+    
+    def refresh_living_costs(self):
+        """Cache the housing and food costs implied by the (fixed) education path"""
+        living_costs = GameConfig.LIVING_COSTS
+        is_student = education_key(self.education_path) in STUDENT_EDUCATIONS
+        self._housing_cost = living_costs["housing"]["student_dorm" if is_student else "student_shared"]
+        self._food_cost = living_costs["food"]["basic"]
     
     def check_achievements(self) -> List[str]:
         """Check for newly earned achievements"""
-        new_achievements = []
-        
-        for achievement_id, achievement in Achievements.ACHIEVEMENT_LIST.items():
-            if achievement_id in self.achievements_earned:
-                continue
-                
-            # Simple condition checking (could be expanded)
-            condition = achievement["condition"]
-            
-            if condition == "monthly_income > 0" and self.monthly_income > 0:
-                new_achievements.append(achievement_id)
-            elif condition == "savings_account >= 1000" and self.savings_account >= 1000:
-                new_achievements.append(achievement_id)
-            elif condition == "education_debt <= 0" and self.education_debt <= 0:
-                new_achievements.append(achievement_id)
-            elif condition == "sum(investments.values()) > 0" and sum(self.investments.values()) > 0:
-                new_achievements.append(achievement_id)
-            elif condition == "credit_score >= 750" and self.credit_score >= 750:
-                new_achievements.append(achievement_id)
-            elif condition == "get_net_worth() > 0" and self.get_net_worth() > 0:
-                new_achievements.append(achievement_id)
+        earned = self._earned_set
+        new_achievements = [
+            achievement_id for achievement_id, check in _CHECKED_ACHIEVEMENTS
+            if achievement_id not in earned and check(self)
+        ]
         
         # Add to earned achievements
         for achievement_id in new_achievements:
             self.achievements_earned.append(achievement_id)
-            self.wellbeing_score += Achievements.ACHIEVEMENT_LIST[achievement_id]["reward_wellbeing"]
+            earned.add(achievement_id)
+            self.wellbeing_score += Achievements.ACHIEVEMENT_LIST[achievement_id].reward_wellbeing
         
         return new_achievements
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for saving"""
-        return {
-            "player_name": self.player_name,
-            "player_age": self.player_age,
-            "current_chapter": self.current_chapter,
-            "game_month": self.game_month,
-            "cash": self.cash,
-            "monthly_income": self.monthly_income,
-            "monthly_expenses": self.monthly_expenses,
-            "education_path": self.education_path,
-            "career": self.career,
-            "education_debt": self.education_debt,
-            "credit_score": self.credit_score,
-            "savings_account": self.savings_account,
-            "investments": self.investments,
-            "life_goals": self.life_goals,
-            "wellbeing_score": self.wellbeing_score,
-            "goals_completed": self.goals_completed,
-            "achievements_earned": self.achievements_earned,
-            "vehicle": self.vehicle,
-            "vehicle_condition": self.vehicle_condition,
-            "part_time_job": self.part_time_job,
-            "debt": self.debt,
-            "career_started": self.career_started,
-            "save_date": self.save_date,
-            "total_playtime": self.total_playtime
-        }
+        return dict(zip(self._SAVE_FIELDS, self._read_save_fields(self)))
     
     def from_dict(self, data: Dict[str, Any]):
         """Load from dictionary"""
-        for key, value in data.items():
-            if hasattr(self, key):
-                setattr(self, key, value)
+        for field in self._SAVE_FIELDS:
+            if field in data:
+                setattr(self, field, data[field])
+        if self.vehicle == "none":  # Older saves could store the "No Vehicle" option as a vehicle
+            self.vehicle = None
+        self._expense_total = sum(self.monthly_expenses.values())
+        self._investment_total = sum(self.investments.values())
+        self._earned_set = set(self.achievements_earned)
+        self.refresh_living_costs()
 
 
 class EnhancedGameEngine:
     """Enhanced game engine with better architecture"""
     
+    __slots__ = ("ui", "state", "running", "_status")
+    
+    # Keys of the status dict passed to display_financial_status
+    _STATUS_KEYS = (
+        "age", "month", "cash", "monthly_income", "education_debt",
+        "savings_account", "net_worth", "credit_score", "wellbeing_score"
+    )
+    
     def __init__(self, interface_type: str = "console"):
         self.ui: UserInterface = create_interface(interface_type)
         self.state = GameState()
         self.running = True
+        self._status: Dict[str, Any] = dict.fromkeys(self._STATUS_KEYS)  # Refilled by financial_status
         
         # Ensure configuration is valid
         if not GameConfig.validate_config():
@@ -165,7 +394,7 @@ class EnhancedGameEngine:
     
     def run(self):
         """Main game loop"""
-        self.ui.display_text(GameText.WELCOME_MESSAGE)
+        self.ui.display_text(GameText.welcome_message())
         
         while self.running:
             choice = self.show_main_menu()
@@ -222,29 +451,28 @@ Press Enter to return to main menu...
                 break
             self.ui.display_text("Please enter a name.", "warning")
         
-        self.ui.display_text(f"\nHello, {self.state.player_name}!")
-        self.ui.display_text("You're 18 years old and about to graduate high school.")
-        self.ui.display_text("It's time to make some important decisions about your future!")
+        self.ui.display_text(
+            f"\nHello, {self.state.player_name}!\n"
+            "You're 18 years old and about to graduate high school.\n"
+            "It's time to make some important decisions about your future!"
+        )
         
         self.select_life_goals()
         self.start_chapter_1()
     
     def select_life_goals(self):
         """Let player select life goals"""
-        self.ui.display_text("\nWhat are your main life goals? (Choose up to 3)")
-        
-        for i, goal in enumerate(GameText.LIFE_GOALS_OPTIONS, 1):
-            self.ui.display_text(f"{i}. {goal}")
-        
-        self.ui.display_text("\nEnter the numbers of your chosen goals (e.g., 1,3,5):")
+        lines = ["\nWhat are your main life goals? (Choose up to 3)"]
+        lines.extend(f"{i}. {goal}" for i, goal in enumerate(GameText.LIFE_GOALS_OPTIONS, 1))
+        lines.append("\nEnter the numbers of your chosen goals (e.g., 1,3,5):")
+        self.ui.display_text("\n".join(lines))
         
         while True:
             try:
                 response = self.ui.get_input("Goals: ")
                 goal_nums = [int(num.strip()) for num in response.split(',') if num.strip()]
                 
-                if len(goal_nums) <= GameConfig.MAX_LIFE_GOALS and \
-                   all(1 <= num <= len(GameText.LIFE_GOALS_OPTIONS) for num in goal_nums):
+                if len(goal_nums) <= GameConfig.MAX_LIFE_GOALS and _VALID_GOAL_NUMBERS.issuperset(goal_nums):
                     self.state.life_goals = [GameText.LIFE_GOALS_OPTIONS[num-1] for num in goal_nums]
                     break
                 else:
@@ -258,42 +486,40 @@ Press Enter to return to main menu...
     
     def start_chapter_1(self):
         """Chapter 1: High School Graduation"""
-        self.ui.display_text(GameText.CHAPTER_1_INTRO)
-        
-        self.ui.display_text("Your options:")
-        for key, path in GameText.EDUCATION_PATHS.items():
-            self.ui.display_text(f"{key}. {path['name']} - {path['description']}")
+        lines = [GameText.chapter_1_intro(), "Your options:"]
+        lines.extend(f"{number}. {path.name} - {path.description}"
+                     for number, path in enumerate(GameText.EDUCATION_PATHS, 1))
+        self.ui.display_text("\n".join(lines))
         
-        choice = self.ui.get_input("\nWhat path will you choose? (1-5): ", 
-                                 list(GameText.EDUCATION_PATHS.keys()))
+        choice = self.ui.get_input(f"\nWhat path will you choose? (1-{len(GameText.EDUCATION_PATHS)}): ", 
+                                 GameText.EDUCATION_PATH_CHOICES)
         
         self.process_education_choice(choice)
     
     def process_education_choice(self, choice: str):
         """Process education path choice"""
-        path = GameText.EDUCATION_PATHS[choice]
-        
-        self.state.education_path = path["name"]
-        
-        if "debt" in path:
-            self.state.education_debt = path["debt"]
-            self.state.cash -= min(2000, self.state.cash * 0.2)  # Initial costs
+        index = int(choice) - 1
+        if not 0 <= index < len(GameText.EDUCATION_PATHS):
+            raise ValueError(f"Invalid education path choice: {choice}")
+        path = GameText.EDUCATION_PATHS[index]
         
-        if "startup_cost" in path:
-            self.state.cash -= path["startup_cost"]
+        self.state.education_path = path.name
+        self.state.refresh_living_costs()
         
-        if "immediate_income" in path:
-            self.state.monthly_income = path["immediate_income"]
+        self.state.education_debt = path.debt
+        initial_costs = min(GameConfig.INITIAL_COSTS_CAP, self.state.cash * GameConfig.INITIAL_COSTS_SHARE)
+        self.state.cash -= initial_costs + path.startup_cost
+        self.state.monthly_income = path.immediate_income
         
-        self.ui.display_text(f"\nYou've chosen: {path['name']}!", "success")
+        self.ui.display_text(f"\nYou've chosen: {path.name}!", "success")
         
         # Show consequences
-        if path.get("debt", 0) > 0:
-            self.ui.display_text(f"This will cost about ${path['debt']:,} in loans.", "warning")
-        if path.get("immediate_income", 0) > 0:
-            self.ui.display_text(f"You'll start earning ${path['immediate_income']:,}/month.", "success")
-        if "startup_cost" in path:
-            self.ui.display_text(f"You've invested ${path['startup_cost']:,} in startup costs.", "info")
+        if path.debt > 0:
+            self.ui.display_text(f"This will cost about ${path.debt:,} in loans.", "warning")
+        if path.immediate_income > 0:
+            self.ui.display_text(f"You'll start earning ${path.immediate_income:,}/month.", "success")
+        if path.startup_cost:
+            self.ui.display_text(f"You've invested ${path.startup_cost:,} in startup costs.", "info")
         
         self.ui.pause_for_input()
         self.continue_game()
@@ -301,11 +527,12 @@ Press Enter to return to main menu...
     def continue_game(self):
         """Enhanced simulation with complex decision-making"""
         # Vehicle decision if player is old enough and doesn't have one
-        if self.state.player_age >= 16 and not hasattr(self.state, 'vehicle'):
+        if self.state.player_age >= 16 and self.state.vehicle is None:
             self.vehicle_decision()
         
-        # Part-time job consideration for students
-        if self.state.education_path in ["Community college", "4-Year University", "Trade School"]:
+        # Part-time job consideration on paths that leave time for one
+        path = EDUCATION_PATHS_BY_NAME.get(self.state.education_path)
+        if path is not None and path.allows_part_time:
             self.part_time_job_decision()
         
         # Enhanced monthly simulation with time scaling
@@ -320,8 +547,7 @@ Press Enter to return to main menu...
         
         while current_month <= target_months:
             # Show current month and age
-            age_in_months = (self.state.player_age * 12) + current_month
-            current_age = age_in_months // 12
+            current_age = GameConfig.STARTING_AGE + self.state.game_month // 12
             self.state.player_age = current_age  # Update player age
             
             self.ui.display_header(f"MONTH {current_month} - AGE {current_age}")
@@ -343,12 +569,12 @@ Press Enter to return to main menu...
                 current_month += 1
             
             # Check for major life stage transitions
-            if current_age >= 22 and not hasattr(self.state, 'career_started'):
+            if current_age >= 22 and not self.state.career_started:
                 self.career_transition()
                 self.state.career_started = True
             
             # Vehicle upgrade decision every 2 years
-            if current_month % 24 == 0 and hasattr(self.state, 'vehicle'):
+            if current_month % 24 == 0 and self.state.vehicle:
                 self.vehicle_upgrade_decision()
     
     def time_scaling_decision(self, current_month: int, target_months: int) -> int:
@@ -358,50 +584,32 @@ Press Enter to return to main menu...
         self.ui.display_text("\n⏰ TIME MANAGEMENT", "info")
         self.ui.display_text("How would you like to proceed with time?")
         
-        options = []
-        if remaining_months > 0:
-            options.append("Continue month by month")
-        if remaining_months >= 3:
-            options.append("Skip ahead 3 months (quick progress)")
-        if remaining_months >= 6:
-            options.append("Skip ahead 6 months (fast progress)")
-        
-        choice = self.ui.display_menu("Time Options", options)
-        
-        if choice == "1":
-            return 1
-        elif choice == "2" and len(options) >= 2:
-            return 3
-        elif choice == "3" and len(options) >= 3:
-            return 6
-        else:
+        # Offer every step that still fits in the remaining months
+        option_count = sum(1 for months in GameConfig.TIME_SKIP_OPTIONS if months <= remaining_months)
+        if option_count == 0:
             return 1
+        
+        choice = self.ui.display_menu("Time Options", list(_TIME_SKIP_LABELS[:option_count]))
+        return GameConfig.TIME_SKIP_OPTIONS[int(choice) - 1]
     
     def skip_time_period(self, months: int):
         """Simulate multiple months quickly"""
         self.ui.display_text(f"\n⏩ Skipping ahead {months} months...", "info")
         
-        for month in range(months):
-            # Simplified month simulation
-            self.state.game_month += 1
-            
-            # Basic income and expenses
-            net_income = self.state.monthly_income - sum(self.state.monthly_expenses.values())
-            self.state.cash += net_income
-            
-            # Small chance of events during skip
-            if random.random() < 0.1:  # 10% chance per month
-                self.quick_random_event()
-            
-            # Part-time job income if applicable
-            if hasattr(self.state, 'part_time_job') and self.state.part_time_job:
-                part_time_income = GameConfig.PART_TIME_JOB_WAGES.get(self.state.part_time_job, 0)
-                self.state.cash += part_time_income
+        # Income and expenses are fixed while skipping, so apply them in one step
+        net_income = self.state.get_monthly_cash_flow()
+        self.state.cash = simulate_passive_months(self.state.cash, net_income, months)
+        self.state.game_month += months
+        
+        # Small chance of events during skip: draw how many happen, then run them
+        event_count = count_successes(months, SKIP_EVENT_CHANCE)
+        for _ in range(event_count):
+            self.quick_random_event()
         
         # Show summary of skip period
         self.ui.display_text(f"📊 Summary of {months} months:", "info")
         self.ui.display_text(f"   Current cash: ${self.state.cash:,.2f}")
-        if hasattr(self.state, 'vehicle'):
+        if self.state.vehicle:
             self.ui.display_text(f"   Vehicle condition: {self.get_vehicle_condition()}")
         self.ui.pause_for_input()
     
@@ -411,17 +619,16 @@ Press Enter to return to main menu...
         self.ui.display_text("You need to decide about transportation.")
         self.ui.display_text("Having a car gives you more job opportunities but costs money.")
         
-        # Show vehicle options based on player's cash
-        affordable_vehicles = []
-        for vehicle_id, vehicle in GameConfig.VEHICLE_OPTIONS.items():
-            if vehicle['purchase_cost'] <= self.state.cash * 1.2:  # Allow slight stretching
-                affordable_vehicles.append((vehicle_id, vehicle))
+        # Show vehicle options based on player's cash; "none" is already option 1
+        budget = self.state.cash * 1.2  # Allow slight stretching
+        affordable_vehicles = [
+            (vehicle_id, vehicle) for vehicle_id, vehicle in GameConfig.VEHICLE_OPTIONS.items()
+            if vehicle_id != "none" and vehicle['purchase_cost'] <= budget
+        ]
         
+        # Option 1 is "no vehicle", so option N maps to affordable_vehicles[N - 2]
         options = ["No vehicle (walk/bike/public transport)"]
-        for vehicle_id, vehicle in affordable_vehicles:
-            cost_text = f"${vehicle['purchase_cost']:,}"
-            monthly_text = f"${vehicle['monthly_cost']:,}/month"
-            options.append(f"{vehicle['name']} - {cost_text} ({monthly_text})")
+        options.extend(vehicle['menu_label'] for _, vehicle in affordable_vehicles)
         
         choice = self.ui.display_menu("Transportation Options", options)
         
@@ -437,13 +644,13 @@ Press Enter to return to main menu...
                     self.ui.display_text("You'll need to take a loan for this vehicle.", "warning")
                     loan_amount = vehicle['purchase_cost'] - self.state.cash
                     self.state.cash = 0
-                    self.state.debt = getattr(self.state, 'debt', 0) + loan_amount
+                    self.state.debt += loan_amount
                 else:
                     self.state.cash -= vehicle['purchase_cost']
                 
                 self.state.vehicle = vehicle_id
                 self.state.vehicle_condition = 100  # Start with perfect condition
-                self.state.monthly_expenses['transportation'] += vehicle['monthly_cost']
+                self.state.add_expense('transportation', vehicle['monthly_cost'])
                 
                 self.ui.display_text(f"You bought a {vehicle['name']}!", "success")
                 self.ui.display_text(f"Monthly costs: ${vehicle['monthly_cost']:,}", "info")
@@ -457,17 +664,15 @@ Press Enter to return to main menu...
         self.ui.display_text("However, working too much might affect your grades!")
         
         # Show available part-time jobs
-        available_jobs = []
-        for job_id, job_info in GameConfig.PART_TIME_JOBS.items():
-            education_req = job_info.get('education_compatible', [])
-            if not education_req or self.state.education_path in education_req:
-                available_jobs.append((job_id, job_info))
+        job_ids = part_time_jobs_for(self.state.education_path)
+        job_views = GameText.part_time_jobs()
+        available_jobs = [(job_id, job_views[job_id]) for job_id in job_ids]
         
         options = ["Focus only on studies (no part-time job)"]
         for job_id, job_info in available_jobs:
             wage_text = f"${job_info['hourly_wage']}/hour"
-            hours_text = f"~{job_info['max_hours_per_week']} hours/week"
-            options.append(f"{job_info['title']} - {wage_text} ({hours_text})")
+            hours_text = f"~{job_info['hours_per_week']} hours/week"
+            options.append(f"{job_info['name']} - {wage_text} ({hours_text})")
         
         choice = self.ui.display_menu("Part-time Job Options", options)
         
@@ -480,12 +685,10 @@ Press Enter to return to main menu...
                 job_id, job_info = available_jobs[job_index]
                 self.state.part_time_job = job_id
                 
-                # Calculate monthly income (assuming 4 weeks per month)
-                weekly_income = job_info['hourly_wage'] * job_info['max_hours_per_week']
-                monthly_income = weekly_income * 4
+                monthly_income = part_time_monthly_wage(GameConfig.PART_TIME_JOBS[job_id])
                 
                 self.state.monthly_income += monthly_income
-                self.ui.display_text(f"You got a job as a {job_info['title']}!", "success")
+                self.ui.display_text(f"You got a job as a {job_info['name']}!", "success")
                 self.ui.display_text(f"Additional monthly income: ${monthly_income:,}", "success")
                 
                 # Slight impact on wellbeing due to busy schedule
@@ -496,7 +699,7 @@ Press Enter to return to main menu...
     
     def get_vehicle_condition(self) -> str:
         """Get vehicle condition description"""
-        if not hasattr(self.state, 'vehicle') or not self.state.vehicle:
+        if not self.state.vehicle:
             return "No vehicle"
         
         condition = self.state.vehicle_condition
@@ -521,7 +724,7 @@ Press Enter to return to main menu...
         
         available_events = []
         for event in events:
-            if event.get("requires_vehicle") and not hasattr(self.state, 'vehicle'):
+            if event.get("requires_vehicle") and not self.state.vehicle:
                 continue
             available_events.append(event)
         
@@ -535,23 +738,14 @@ Press Enter to return to main menu...
         self.ui.display_text("You're ready to start your career!", "success")
         
         # Load expanded career data
-        try:
-            with open('data/expanded_content.json', 'r') as f:
-                career_data = json.load(f)
-        except FileNotFoundError:
+        career_data = expanded_content_or_none()
+        if career_data is None:
             self.ui.display_text("Career data not found, using basic options.", "warning")
             return
         
         # Select appropriate career options based on education
-        education_to_career = {
-            "High School": "high_school_entry",
-            "Community College": "associate_degree", 
-            "Trade School": "trade_school",
-            "4-Year University": "bachelor_degree",
-            "Military Service": "military_specializations"
-        }
-        
-        career_category = education_to_career.get(self.state.education_path, "high_school_entry")
+        career_category = _EDUCATION_TO_CAREER.get(education_key(self.state.education_path),
+                                                   "high_school_entry")
         available_careers = career_data.get("expanded_careers", {}).get(career_category, [])
         
         if available_careers:
@@ -569,13 +763,13 @@ Press Enter to return to main menu...
             self.ui.display_text(f"Starting salary: ${selected_career['starting_salary']:,}/year", "info")
             
             # Remove part-time job if transitioning to full-time career
-            if hasattr(self.state, 'part_time_job') and self.state.part_time_job:
+            if self.state.part_time_job:
                 self.state.part_time_job = None
                 self.ui.display_text("You've left your part-time job for your career.", "info")
     
     def vehicle_upgrade_decision(self):
         """Let player decide whether to upgrade their vehicle"""
-        if not hasattr(self.state, 'vehicle') or not self.state.vehicle:
+        if not self.state.vehicle:
             return
         
         current_vehicle = GameConfig.VEHICLE_OPTIONS.get(self.state.vehicle)
@@ -606,9 +800,24 @@ Press Enter to return to main menu...
             sale_value = max(1000, current_vehicle['purchase_cost'] * 0.3)  # Depreciated value
             self.state.cash += sale_value
             self.state.vehicle = None
-            self.state.monthly_expenses['transportation'] -= current_vehicle['monthly_cost']
+            self.state.add_expense('transportation', -current_vehicle['monthly_cost'])
             self.ui.display_text(f"You sold your vehicle for ${sale_value:,}", "success")
     
+    def financial_status(self) -> Dict[str, Any]:
+        """Current status for display, refilled in one reused dict (callers must not keep it)"""
+        state = self.state
+        status = self._status
+        status["age"] = state.player_age
+        status["month"] = state.game_month
+        status["cash"] = state.cash
+        status["monthly_income"] = state.monthly_income
+        status["education_debt"] = state.education_debt
+        status["savings_account"] = state.savings_account
+        status["net_worth"] = state.get_net_worth()
+        status["credit_score"] = state.credit_score
+        status["wellbeing_score"] = state.wellbeing_score
+        return status
+    
     def simulate_month(self):
         """Simulate one month"""
         self.state.game_month += 1
@@ -616,29 +825,18 @@ Press Enter to return to main menu...
         self.ui.display_header(f"MONTH {self.state.game_month}")
         
         # Display financial status
-        status = {
-            'age': self.state.player_age,
-            'month': self.state.game_month,
-            'cash': self.state.cash,
-            'monthly_income': self.state.monthly_income,
-            'education_debt': self.state.education_debt,
-            'savings_account': self.state.savings_account,
-            'net_worth': self.state.get_net_worth(),
-            'credit_score': self.state.credit_score,
-            'wellbeing_score': self.state.wellbeing_score
-        }
-        self.ui.display_financial_status(status)
+        self.ui.display_financial_status(self.financial_status())
         
         # Monthly budgeting if player has income
         if self.state.monthly_income > 0:
             self.monthly_budgeting()
         
         # Random events
-        if random.random() < GameConfig.RANDOM_EVENT_CHANCE:
+        if _random() < RANDOM_EVENT_CHANCE:
             self.random_event()
         
         # Mini-games
-        if random.random() < GameConfig.MINIGAME_CHANCE:
+        if _random() < MINIGAME_CHANCE:
             self.play_random_minigame()
         
         # Apply monthly changes
@@ -648,34 +846,36 @@ Press Enter to return to main menu...
         new_achievements = self.state.check_achievements()
         for achievement_id in new_achievements:
             achievement = Achievements.ACHIEVEMENT_LIST[achievement_id]
-            self.ui.display_text(f"🏆 ACHIEVEMENT UNLOCKED: {achievement['name']}", "success")
-            self.ui.display_text(f"   {achievement['description']}")
+            self.ui.display_text(f"🏆 ACHIEVEMENT UNLOCKED: {achievement.name}", "success")
+            self.ui.display_text(f"   {achievement.description}")
     
     def monthly_budgeting(self):
         """Handle monthly budgeting"""
-        self.ui.display_text(f"\n💰 MONTHLY BUDGETING")
-        self.ui.display_text(f"Income this month: ${self.state.monthly_income:,.2f}")
-        
         # Essential expenses
-        housing_cost = GameConfig.LIVING_COSTS["housing_student"] if "college" in self.state.education_path.lower() else GameConfig.LIVING_COSTS["housing_shared"]
-        food_cost = GameConfig.LIVING_COSTS["food_basic"]
-        
-        self.ui.display_text(f"\nEssential expenses:")
-        self.ui.display_text(f"Housing: ${housing_cost:,.2f}")
-        self.ui.display_text(f"Food: ${food_cost:,.2f}")
+        housing_cost = self.state.housing_cost
+        food_cost = self.state.food_cost
+        transport_costs = GameConfig.LIVING_COSTS["transport"]
+        
+        self.ui.display_text(
+            f"\n💰 MONTHLY BUDGETING\n"
+            f"Income this month: ${self.state.monthly_income:,.2f}\n"
+            f"\nEssential expenses:\n"
+            f"Housing: ${housing_cost:,.2f}\n"
+            f"Food: ${food_cost:,.2f}"
+        )
         
         # Transportation choice
         transport_choice = self.ui.get_input(
-            f"Transportation: (1) Public transit (${GameConfig.LIVING_COSTS['transport_public']}/month) or (2) Car (${GameConfig.LIVING_COSTS['transport_car']}/month)? (1/2): ",
+            f"Transportation: (1) Public transit (${transport_costs['public']}/month) or (2) Car (${transport_costs['used_car']}/month)? (1/2): ",
             ["1", "2"]
         )
         
-        transport_cost = GameConfig.LIVING_COSTS["transport_public"] if transport_choice == "1" else GameConfig.LIVING_COSTS["transport_car"]
+        transport_cost = transport_costs["public" if transport_choice == "1" else "used_car"]
         
         # Update expenses
-        self.state.monthly_expenses["housing"] = housing_cost
-        self.state.monthly_expenses["food"] = food_cost
-        self.state.monthly_expenses["transportation"] = transport_cost
+        self.state.set_expenses({
+            "housing": housing_cost, "food": food_cost, "transportation": transport_cost
+        })
         
         remaining = self.state.monthly_income - housing_cost - food_cost - transport_cost
         
@@ -690,33 +890,33 @@ Press Enter to return to main menu...
         choice = self.ui.display_menu("How to allocate remaining money?", options)
         
         if choice == "1":  # Entertainment
-            self.state.monthly_expenses["entertainment"] = remaining
+            self.state.set_expense("entertainment", remaining)
             self.state.wellbeing_score += 5
             self.ui.display_text("You spent it all on fun! Happiness increased.", "info")
         
         elif choice == "2":  # Savings
-            self.state.monthly_expenses["savings"] = remaining
+            self.state.set_expense("savings", remaining)
             self.state.savings_account += remaining
             self.ui.display_text("Smart! You saved all your extra money.", "success")
         
         elif choice == "3" and self.state.education_debt > 0:  # Debt payments
-            self.state.monthly_expenses["debt_payments"] = remaining
+            self.state.set_expense("debt_payments", remaining)
             self.state.education_debt -= remaining
             self.ui.display_text("Excellent! You made extra debt payments.", "success")
         
         elif choice == "4":  # Split
-            entertainment = remaining * 0.5
+            state = self.state
             savings = remaining * 0.3
-            debt_payment = remaining * 0.2
+            split = {"entertainment": remaining * 0.5, "savings": savings}
+            state.savings_account += savings
+            state.wellbeing_score += 3
             
-            self.state.monthly_expenses["entertainment"] = entertainment
-            self.state.monthly_expenses["savings"] = savings
-            self.state.savings_account += savings
-            self.state.wellbeing_score += 3
+            if state.education_debt > 0:
+                debt_payment = remaining * 0.2
+                split["debt_payments"] = debt_payment
+                state.education_debt -= debt_payment
             
-            if self.state.education_debt > 0:
-                self.state.monthly_expenses["debt_payments"] = debt_payment
-                self.state.education_debt -= debt_payment
+            state.set_expenses(split)
             
             self.ui.display_text("Balanced approach! You split your money wisely.", "success")
     
@@ -724,128 +924,118 @@ Press Enter to return to main menu...
         """Generate random life event using expanded content"""
         # Try to load expanded events
         try:
-            with open('data/expanded_content.json', 'r') as f:
-                content_data = json.load(f)
-            
-            # Choose event type based on probability
-            event_roll = random.random()
-            if event_roll < 0.4:  # 40% chance positive
-                event_pool = content_data.get("life_events", {}).get("positive_events", [])
-            elif event_roll < 0.8:  # 40% chance negative  
-                event_pool = content_data.get("life_events", {}).get("negative_events", [])
-            else:  # 20% chance neutral
-                event_pool = content_data.get("life_events", {}).get("neutral_events", [])
-            
-            # Filter events based on conditions
-            available_events = []
-            for event in event_pool:
-                conditions = event.get("conditions", [])
-                if self.check_event_conditions(conditions):
-                    available_events.append(event)
+            # Choose event type, then any eligible event with equal chance
+            category = _EVENT_CATEGORY_TABLE.sample()
+            available_events = available_life_events(category, self.event_condition_mask())
             
             if available_events:
-                event = random.choice(available_events)
+                event = available_events.sample()
                 self.process_expanded_event(event)
                 return
                 
-        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        except KeyError:
             pass  # Fall back to basic events
         
         # Basic fallback events
-        basic_events = [
-            {"name": "Car Repair", "description": "Your car needs $500 in repairs.", "cost": 500, "wellbeing": -5},
-            {"name": "Work Bonus", "description": "Great job! You got a $300 bonus.", "cost": -300, "wellbeing": 10},
-            {"name": "Medical Bill", "description": "Doctor visit cost $200.", "cost": 200, "wellbeing": -3},
-            {"name": "Tax Refund", "description": "You got a $400 tax refund!", "cost": -400, "wellbeing": 5}
-        ]
+        event = random.choice(_BASIC_EVENTS)
         
-        event = random.choice(basic_events)
+        self.ui.display_text(f"\n🎲 RANDOM EVENT: {event.name}", "info")
+        self.ui.display_text(f"   {event.description}")
         
-        self.ui.display_text(f"\n🎲 RANDOM EVENT: {event['name']}", "info")
-        self.ui.display_text(f"   {event['description']}")
+        self.state.cash -= event.cost
+        self.state.wellbeing_score += event.wellbeing
         
-        self.state.cash -= event['cost']
-        self.state.wellbeing_score += event['wellbeing']
-        
-        if event['cost'] > 0:
-            self.ui.display_text(f"   Cost: ${event['cost']:,.2f}", "warning")
+        if event.cost > 0:
+            self.ui.display_text(f"   Cost: ${event.cost:,.2f}", "warning")
         else:
-            self.ui.display_text(f"   Gained: ${abs(event['cost']):,.2f}", "success")
+            self.ui.display_text(f"   Gained: ${abs(event.cost):,.2f}", "success")
     
-    def check_event_conditions(self, conditions: List[str]) -> bool:
-        """Check if player meets event conditions"""
-        for condition in conditions:
-            if condition == "has_income" and self.state.monthly_income <= 0:
-                return False
-            elif condition == "owns_car" and not hasattr(self.state, 'vehicle'):
-                return False
-            elif condition == "has_job" and not self.state.career and not hasattr(self.state, 'part_time_job'):
-                return False
-            elif condition == "is_student" and self.state.education_path not in ["Community College", "4-Year University", "Trade School"]:
-                return False
-            elif condition == "has_credit_card" and self.state.credit_score < 500:
-                return False
-            elif condition == "rents_apartment" and self.state.monthly_expenses.get("housing", 0) > 0:
-                return False
-        return True
+    def event_condition_mask(self) -> int:
+        """Bitmask of the event conditions the player currently meets"""
+        state = self.state
+        mask = 0
+        if state.monthly_income > 0:
+            mask |= EVENT_CONDITION_BITS["has_income"]
+        if state.vehicle:
+            mask |= EVENT_CONDITION_BITS["owns_car"]
+        if state.career or state.part_time_job:
+            mask |= EVENT_CONDITION_BITS["has_job"]
+        if education_key(state.education_path) in STUDENT_EDUCATIONS:
+            mask |= EVENT_CONDITION_BITS["is_student"]
+        if state.credit_score >= 500:
+            mask |= EVENT_CONDITION_BITS["has_credit_card"]
+        if state.monthly_expenses.get("housing", 0) > 0:
+            mask |= EVENT_CONDITION_BITS["rents_apartment"]
+        return mask
     
     def process_expanded_event(self, event: Dict):
         """Process an expanded event with complex effects"""
-        self.ui.display_text(f"\n🎲 RANDOM EVENT: {event['name']}", "info")
-        self.ui.display_text(f"   {event['description']}")
+        state = self.state
+        lines = [
+            (f"\n🎲 RANDOM EVENT: {event['name']}", "info"),
+            (f"   {event['description']}", "normal"),
+        ]
         
         # Handle cash impact
         if "cash_impact" in event:
-            impact_range = event["cash_impact"]
-            min_val, max_val = min(impact_range), max(impact_range)
-            cash_change = random.randint(min_val, max_val)
-            self.state.cash -= cash_change
+            low, high = event["cash_impact"]
+            cash_change = _random_int(low, high)
+            state.cash -= cash_change
             
             if cash_change > 0:
-                self.ui.display_text(f"   Cost: ${cash_change:,.2f}", "warning")
+                lines.append((f"   Cost: ${cash_change:,.2f}", "warning"))
             else:
-                self.ui.display_text(f"   Gained: ${abs(cash_change):,.2f}", "success")
+                lines.append((f"   Gained: ${abs(cash_change):,.2f}", "success"))
         
         # Handle wellbeing impact
         if "wellbeing_impact" in event:
-            wellbeing_range = event["wellbeing_impact"]
-            min_val, max_val = min(wellbeing_range), max(wellbeing_range)
-            wellbeing_change = random.randint(min_val, max_val)
-            self.state.wellbeing_score += wellbeing_change
+            low, high = event["wellbeing_impact"]
+            wellbeing_change = _random_int(low, high)
+            state.wellbeing_score += wellbeing_change
             
             if wellbeing_change > 0:
-                self.ui.display_text(f"   Wellbeing improved by {wellbeing_change}", "success")
+                lines.append((f"   Wellbeing improved by {wellbeing_change}", "success"))
             else:
-                self.ui.display_text(f"   Wellbeing decreased by {abs(wellbeing_change)}", "warning")
+                lines.append((f"   Wellbeing decreased by {abs(wellbeing_change)}", "warning"))
         
         # Handle special effects
         if "debt_reduction" in event:
-            reduction_range = event["debt_reduction"]
-            reduction = random.randint(reduction_range[0], reduction_range[1])
-            if self.state.education_debt > 0:
-                actual_reduction = min(reduction, self.state.education_debt)
-                self.state.education_debt -= actual_reduction
-                self.ui.display_text(f"   Student loan reduced by ${actual_reduction:,.2f}!", "success")
+            low, high = event["debt_reduction"]
+            reduction = _random_int(low, high)
+            if state.education_debt > 0:
+                actual_reduction = min(reduction, state.education_debt)
+                state.education_debt -= actual_reduction
+                lines.append((f"   Student loan reduced by ${actual_reduction:,.2f}!", "success"))
         
         if "salary_increase" in event:
-            increase_range = event["salary_increase"]
-            increase_percent = random.uniform(increase_range[0], increase_range[1])
-            old_income = self.state.monthly_income
-            self.state.monthly_income *= (1 + increase_percent)
-            increase_amount = self.state.monthly_income - old_income
-            self.ui.display_text(f"   Monthly income increased by ${increase_amount:,.2f}!", "success")
+            low, high = event["salary_increase"]
+            increase_amount = state.monthly_income * random.uniform(low, high)
+            state.monthly_income += increase_amount
+            lines.append((f"   Monthly income increased by ${increase_amount:,.2f}!", "success"))
         
         if "credit_score_impact" in event:
-            impact_range = event["credit_score_impact"]
-            score_change = random.randint(impact_range[0], impact_range[1])
-            self.state.credit_score += score_change
-            self.state.credit_score = max(300, min(850, self.state.credit_score))  # Keep in valid range
+            low, high = event["credit_score_impact"]
+            score_change = _random_int(low, high)
+            score = state.credit_score + score_change
+            # Keep in valid range
+            state.credit_score = (
+                CREDIT_SCORE_MIN if score < CREDIT_SCORE_MIN
+                else CREDIT_SCORE_MAX if score > CREDIT_SCORE_MAX
+                else score
+            )
+        
+        self.ui.display_text_batch(lines)
     
     def play_random_minigame(self):
         """Play a random mini-game"""
+        # Imported here so sessions that never roll a mini-game skip loading the module
+        from minigames import get_random_minigame
+        
         game_type = get_random_minigame(self.state.cash, self.state.monthly_income)
         
-        if game_type is None:
+        # Only offer games the engine knows how to run
+        play_game = self._MINIGAME_HANDLERS.get(game_type)
+        if play_game is None:
             return
         
         self.ui.display_text("\n🎮 MINI-GAME OPPORTUNITY!", "info")
@@ -854,49 +1044,64 @@ Press Enter to return to main menu...
         if play_choice.lower() not in ["y", "yes"]:
             return
         
-        # Play the appropriate mini-game
-        if game_type == "comparison_shopping":
-            game = ComparisonShoppingGame()
-            budget = min(self.state.cash * 0.3, 1000)
-            result = game.play(budget)
-            if result["success"]:
-                self.state.cash -= result["cost"]
-                self.state.wellbeing_score += result["wellbeing_bonus"]
-        
-        # Add other mini-games as implemented...
+        play_game(self)
+    
+    def _play_comparison_shopping(self):
+        """Run the comparison shopping mini-game and apply its result"""
+        from minigames import ComparisonShoppingGame
+        
+        game = ComparisonShoppingGame()
+        budget = min(self.state.cash * 0.3, 1000)
+        result = game.play(budget)
+        if result["success"]:
+            self.state.cash -= result["cost"]
+            self.state.wellbeing_score += result["wellbeing_bonus"]
+    
+    # Mini-game type -> engine method that plays it; add other mini-games here as implemented
+    _MINIGAME_HANDLERS = {
+        "comparison_shopping": _play_comparison_shopping,
+    }
     
     def apply_monthly_changes(self):
         """Apply end-of-month changes"""
+        state = self.state
+        
         # Apply cash flow
-        cash_flow = self.state.get_monthly_cash_flow()
-        self.state.cash += cash_flow
+        cash_flow = state.get_monthly_cash_flow()
+        state.cash += cash_flow
         
         # Apply debt interest
-        if self.state.education_debt > 0:
-            monthly_interest = GameConfig.DEBT_INTEREST_RATE / 12
-            self.state.education_debt += self.state.education_debt * monthly_interest
+        if state.education_debt > 0:
+            state.education_debt *= MONTHLY_DEBT_FACTOR
         
         # Age the player
-        if self.state.game_month % 12 == 0:
-            self.state.player_age += 1
+        if state.game_month % 12 == 0:
+            state.player_age += 1
         
         # Ensure values stay in valid ranges
-        self.state.credit_score = max(GameConfig.CREDIT_SCORE_RANGE[0], 
-                                    min(self.state.credit_score, GameConfig.CREDIT_SCORE_RANGE[1]))
-        self.state.wellbeing_score = max(GameConfig.WELLBEING_RANGE[0],
-                                       min(self.state.wellbeing_score, GameConfig.WELLBEING_RANGE[1]))
+        score = state.credit_score
+        state.credit_score = (
+            CREDIT_SCORE_MIN if score < CREDIT_SCORE_MIN
+            else CREDIT_SCORE_MAX if score > CREDIT_SCORE_MAX
+            else score
+        )
+        wellbeing = state.wellbeing_score
+        state.wellbeing_score = (
+            WELLBEING_MIN if wellbeing < WELLBEING_MIN
+            else WELLBEING_MAX if wellbeing > WELLBEING_MAX
+            else wellbeing
+        )
     
     def save_game(self, filename: Optional[str] = None) -> bool:
         """Save game state"""
         if filename is None:
-            filename = f"{self.state.player_name}_save.json"
+            filename = f"{self.state.player_name}_save{GameConfig.SAVE_FILE_EXTENSION}"
         
-        filepath = GameConfig.get_save_file_path(filename)
-        self.state.save_date = datetime.now().isoformat()
+        filepath = get_save_file_path(filename)
+        self.state.save_date = strftime("%Y-%m-%dT%H:%M:%S", localtime())
         
         try:
-            with open(filepath, 'w') as f:
-                json.dump(self.state.to_dict(), f, indent=2)
+            write_json_file(filepath, self.state.to_dict())
             self.ui.display_text(f"Game saved as {filename}", "success")
             return True
         except Exception as e:
@@ -905,7 +1110,9 @@ Press Enter to return to main menu...
     
     def load_game(self) -> bool:
         """Load a saved game"""
-        save_files = [f for f in os.listdir(GameConfig.SAVES_DIR) if f.endswith('.json')]
+        with os.scandir(GameConfig.SAVES_DIR) as entries:
+            save_files = sorted(entry.name for entry in entries
+                                if entry.name.endswith(SAVE_FILE_EXTENSIONS) and entry.is_file())
         
         if not save_files:
             self.ui.display_text("No saved games found.", "warning")
@@ -920,10 +1127,9 @@ Press Enter to return to main menu...
             choice = int(choice_str) - 1
             
             if 0 <= choice < len(save_files):
-                filepath = GameConfig.get_save_file_path(save_files[choice])
+                filepath = get_save_file_path(save_files[choice])
                 
-                with open(filepath, 'r') as f:
-                    save_data = json.load(f)
+                save_data = read_json_file(filepath)
                 
                 self.state.from_dict(save_data)
                 self.ui.display_text(f"Game loaded: {self.state.player_name}", "success")
@@ -931,7 +1137,7 @@ Press Enter to return to main menu...
             else:
                 self.ui.display_text("Invalid choice.", "warning")
                 return False
-        except (ValueError, FileNotFoundError, json.JSONDecodeError) as e:
+        except JSON_FILE_ERRORS as e:
             self.ui.display_text(f"Error loading game: {e}", "error")
             return False
     
@@ -945,25 +1151,16 @@ Press Enter to return to main menu...
         self.ui.display_text(f"Education Path: {self.state.education_path}")
         
         self.ui.display_text("\nFINAL FINANCIAL STATUS:", "bold")
-        status = {
-            'age': self.state.player_age,
-            'month': self.state.game_month,
-            'cash': self.state.cash,
-            'monthly_income': self.state.monthly_income,
-            'education_debt': self.state.education_debt,
-            'savings_account': self.state.savings_account,
-            'net_worth': self.state.get_net_worth(),
-            'credit_score': self.state.credit_score,
-            'wellbeing_score': self.state.wellbeing_score
-        }
-        self.ui.display_financial_status(status)
+        self.ui.display_financial_status(self.financial_status())
         
         # Show achievements
         if self.state.achievements_earned:
             self.ui.display_text("ACHIEVEMENTS EARNED:", "success")
-            for achievement_id in self.state.achievements_earned:
-                achievement = Achievements.ACHIEVEMENT_LIST[achievement_id]
-                self.ui.display_text(f"🏆 {achievement['name']}")
+            achievement_list = Achievements.ACHIEVEMENT_LIST
+            self.ui.display_text("\n".join(
+                f"🏆 {achievement_list[achievement_id].name}"
+                for achievement_id in self.state.achievements_earned
+            ))
         
         # Save option
         save_choice = self.ui.get_input("Save this game? (y/n): ", ["y", "n", "yes", "no"])
@@ -5,17 +5,115 @@ A text-based personal finance education game
 Core Game Engine
 """
 
-import json
 import os
 import sys
 import random
+import re
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from operator import attrgetter
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
+from json_files import JSON_FILE_ERRORS, SAVE_FILE_EXTENSIONS, read_json_file, write_json_file
 from minigames import ComparisonShoppingGame, BudgetAllocationGame, InvestmentSimulationGame, get_random_minigame
 
+
+class EducationChoice(NamedTuple):
+    """Effects and description of one Chapter 1 path"""
+    path: str
+    debt: float
+    upfront_cost: float
+    monthly_income: float
+    lines: Tuple[str, ...]
+
+
+# Chapter 1 menu key -> chosen path
+EDUCATION_CHOICES: Dict[str, EducationChoice] = {
+    "1": EducationChoice(
+        "Four-year college", 40000, 2000, 0,  # Average student loan debt, initial costs
+        ("\nYou've chosen to attend a four-year university!",
+         "This will take 4 years and cost about $40,000 in student loans.",
+         "But you'll have access to higher-paying careers afterward.")
+    ),
+    "2": EducationChoice(
+        "Community college/Trade school", 15000, 1000, 0,
+        ("\nYou've chosen community college or trade school!",
+         "This will take 2 years and cost about $15,000.",
+         "You'll learn practical skills and enter the workforce sooner.")
+    ),
+    "3": EducationChoice(
+        "High school diploma", 0, 0, 2400,  # Entry-level job
+        ("\nYou've chosen to start working right away!",
+         "You'll begin earning $2,400/month at an entry-level job.",
+         "No debt, but potentially limited career growth.")
+    ),
+    "4": EducationChoice(
+        "Military service", 0, 0, 2200,  # Military pay
+        ("\nYou've enlisted in the military!",
+         "You'll earn $2,200/month plus benefits and training.",
+         "The military will pay for your education afterward.")
+    ),
+    "5": EducationChoice(
+        "Entrepreneur", 0, 5000, 1500,  # Startup costs, variable income
+        ("\nYou've decided to start your own business!",
+         "You've invested $5,000 of your savings.",
+         "Income is unpredictable but has unlimited potential!")
+    ),
+}
+
+class LifeEvent(NamedTuple):
+    """A random life event; negative cost is a gain"""
+    name: str
+    description: str
+    cost: float
+    wellbeing_impact: int
+
+
+LIFE_EVENTS = (
+    LifeEvent("Car Repair", "Your car broke down and needs $500 in repairs.", 500, -5),
+    LifeEvent("Work Bonus", "Great job! You received a $300 bonus at work.", -300, 10),
+    LifeEvent("Medical Bill", "You had to visit the doctor. Bill: $200.", 200, -3),
+    LifeEvent("Tax Refund", "You got a tax refund of $400!", -400, 5),
+)
+
+# Life-goal answers: comma-separated numbers, where blank entries are skipped
+GOAL_LIST_PATTERN = re.compile(r"\s*\d*\s*(?:,\s*\d*\s*)*")
+GOAL_NUMBER_PATTERN = re.compile(r"\d+")
+
+# Mini-game type -> class; the games keep no state between plays, so one instance each is reused
+MINIGAME_CLASSES = {
+    "comparison_shopping": ComparisonShoppingGame,
+    "budget_allocation": BudgetAllocationGame,
+    "investment_simulation": InvestmentSimulationGame,
+}
+
+# Paths whose players pay student housing in monthly_budgeting
+STUDENT_PATHS = frozenset((EDUCATION_CHOICES["1"].path, EDUCATION_CHOICES["2"].path))
+
+# Monthly chances of a random event and of a mini-game offer
+RANDOM_EVENT_CHANCE = 0.1
+MINIGAME_CHANCE = 0.15
+
+# Student debt balance multiplier per month (4.8% annual interest)
+DEBT_MONTHLY_FACTOR = 1 + 0.048 / 12
+
+# Module-level random.random; seeding the random module still applies
+_random = random.random
+
+
 class GameState:
     """Manages the player's current game state"""
     
+    __slots__ = (
+        "player_name", "player_age", "current_chapter", "game_month",
+        "cash", "monthly_income", "monthly_expenses", "education_path", "career",
+        "education_debt", "credit_score", "savings_account", "investments",
+        "_expense_total", "_investment_total",
+        "life_goals", "wellbeing_score", "goals_completed", "save_date", "total_playtime"
+    )
+    
+    # Everything except the running totals, which from_dict recomputes
+    _SAVE_FIELDS = tuple(field for field in __slots__ if not field.startswith("_"))
+    _read_save_fields = attrgetter(*_SAVE_FIELDS)
+    
     def __init__(self):
         # Player Information
         self.player_name: str = ""
@@ -53,6 +151,11 @@ class GameState:
             "retirement_401k": 0.0
         }
         
+        # Running sums of monthly_expenses and investments, kept in step by
+        # set_expense/add_investment so totals never re-sum the dicts
+        self._expense_total: float = 0.0
+        self._investment_total: float = 0.0
+        
         # Life Goals and Well-being
         self.life_goals: List[str] = []
         self.wellbeing_score: int = 50  # Scale of 0-100
@@ -64,44 +167,64 @@ class GameState:
         
     def to_dict(self) -> Dict[str, Any]:
         """Convert game state to dictionary for saving"""
-        return {
-            "player_name": self.player_name,
-            "player_age": self.player_age,
-            "current_chapter": self.current_chapter,
-            "game_month": self.game_month,
-            "cash": self.cash,
-            "monthly_income": self.monthly_income,
-            "monthly_expenses": self.monthly_expenses,
-            "education_path": self.education_path,
-            "career": self.career,
-            "education_debt": self.education_debt,
-            "credit_score": self.credit_score,
-            "savings_account": self.savings_account,
-            "investments": self.investments,
-            "life_goals": self.life_goals,
-            "wellbeing_score": self.wellbeing_score,
-            "goals_completed": self.goals_completed,
-            "save_date": self.save_date,
-            "total_playtime": self.total_playtime
-        }
+        return dict(zip(self._SAVE_FIELDS, self._read_save_fields(self)))
     
     def from_dict(self, data: Dict[str, Any]):
         """Load game state from dictionary"""
-        for key, value in data.items():
-            if hasattr(self, key):
-                setattr(self, key, value)
+        for field in self._SAVE_FIELDS:
+            if field in data:
+                setattr(self, field, data[field])
+        self._expense_total = sum(self.monthly_expenses.values())
+        self._investment_total = sum(self.investments.values())
     
     def get_net_worth(self) -> float:
         """Calculate total net worth"""
-        assets = (self.cash + self.savings_account + 
-                 sum(self.investments.values()))
+        assets = self.cash + self.savings_account + self._investment_total
         debts = self.education_debt
         return assets - debts
     
     def get_monthly_cash_flow(self) -> float:
         """Calculate monthly cash flow (income - expenses)"""
-        total_expenses = sum(self.monthly_expenses.values())
-        return self.monthly_income - total_expenses
+        return self.monthly_income - self._expense_total
+    
+    def set_expense(self, category: str, amount: float):
+        """Set one monthly expense category, keeping the running total in step"""
+        self._expense_total += amount - self.monthly_expenses.get(category, 0.0)
+        self.monthly_expenses[category] = amount
+    
+    def set_expenses(self, amounts: Dict[str, float]):
+        """Set several monthly expense categories with a single total update"""
+        expenses = self.monthly_expenses
+        delta = 0.0
+        for category, amount in amounts.items():
+            delta += amount - expenses.get(category, 0.0)
+        expenses.update(amounts)
+        self._expense_total += delta
+    
+    def add_investment(self, kind: str, amount: float):
+        """Adjust one investment balance by a (possibly negative) amount"""
+        self.investments[kind] = self.investments.get(kind, 0.0) + amount
+        self._investment_total += amount
+
+
+# Title screen, printed in a single call
+WELCOME_TEXT = "\n".join((
+    "=" * 60,
+    "    ChoiceCents: Your Money Journey",
+    "    A Personal Finance Adventure Game",
+    "=" * 60,
+    "",
+    "Welcome to ChoiceCents! In this game, you'll make",
+    "financial decisions that will shape your life journey.",
+    "Learn about budgeting, saving, investing, and more",
+    "as you navigate from high school graduation to retirement.",
+    "",
+    "Your choices matter - let's begin your money journey!",
+    "",
+))
+
+MAIN_MENU_TEXT = "\n".join(("\n" + "=" * 40, "MAIN MENU", "=" * 40,
+                            "1. New Game", "2. Load Game", "3. Quit", ""))
 
 
 class GameEngine:
@@ -111,51 +234,35 @@ class GameEngine:
         self.state = GameState()
         self.running = True
         self.save_directory = "saves"
+        self._minigames: Dict[str, Any] = {}  # Mini-game instances, created on first play
         
         # Ensure save directory exists
-        if not os.path.exists(self.save_directory):
-            os.makedirs(self.save_directory)
+        os.makedirs(self.save_directory, exist_ok=True)
     
     def display_welcome(self):
         """Display welcome message and game introduction"""
-        print("=" * 60)
-        print("    ChoiceCents: Your Money Journey")
-        print("    A Personal Finance Adventure Game")
-        print("=" * 60)
-        print()
-        print("Welcome to ChoiceCents! In this game, you'll make")
-        print("financial decisions that will shape your life journey.")
-        print("Learn about budgeting, saving, investing, and more")
-        print("as you navigate from high school graduation to retirement.")
-        print()
-        print("Your choices matter - let's begin your money journey!")
-        print()
+        print(WELCOME_TEXT)
     
     def get_player_input(self, prompt: str, valid_options: Optional[List[str]] = None) -> str:
         """Get validated input from player"""
+        # Lowercased option -> original case version, built once for all retries
+        options_by_lower = None if valid_options is None else {
+            option.lower(): option for option in reversed(valid_options)
+        }
         while True:
             response = input(prompt).strip().lower()
             
-            if valid_options is None:
+            if options_by_lower is None:
                 return response
             
-            if response in [option.lower() for option in valid_options]:
-                # Return the original case version
-                for option in valid_options:
-                    if response == option.lower():
-                        return option
+            if response in options_by_lower:
+                return options_by_lower[response]
             
             print(f"Please enter one of: {', '.join(valid_options)}")
     
     def display_main_menu(self):
         """Display main menu options"""
-        print("\n" + "=" * 40)
-        print("MAIN MENU")
-        print("=" * 40)
-        print("1. New Game")
-        print("2. Load Game")
-        print("3. Quit")
-        print()
+        print(MAIN_MENU_TEXT)
         
         choice = self.get_player_input("Choose an option (1-3): ", ["1", "2", "3"])
         return choice
@@ -196,17 +303,17 @@ class GameEngine:
         
         print("\nEnter the numbers of your chosen goals (e.g., 1,3,5):")
         while True:
-            try:
-                goal_nums = input().strip().split(',')
-                goal_nums = [int(num.strip()) for num in goal_nums if num.strip()]
-                
-                if len(goal_nums) <= 3 and all(1 <= num <= len(goals_options) for num in goal_nums):
-                    self.state.life_goals = [goals_options[num-1] for num in goal_nums]
-                    break
-                else:
-                    print("Please enter up to 3 valid numbers.")
-            except ValueError:
+            response = input()
+            if GOAL_LIST_PATTERN.fullmatch(response) is None:
                 print("Please enter numbers separated by commas.")
+                continue
+            goal_nums = [int(num) for num in GOAL_NUMBER_PATTERN.findall(response)]
+            
+            if len(goal_nums) <= 3 and all(1 <= num <= len(goals_options) for num in goal_nums):
+                self.state.life_goals = [goals_options[num-1] for num in goal_nums]
+                break
+            else:
+                print("Please enter up to 3 valid numbers.")
         
         print(f"\nGreat! Your goals are: {', '.join(self.state.life_goals)}")
         print("Remember these as you make decisions - they'll guide your journey!")
@@ -234,52 +341,21 @@ class GameEngine:
         print()
         
         choice = self.get_player_input("What path will you choose? (1-5): ", 
-                                     ["1", "2", "3", "4", "5"])
+                                     list(EDUCATION_CHOICES))
         
         self.process_education_choice(choice)
     
     def process_education_choice(self, choice: str):
         """Process the player's education/career path choice"""
-        if choice == "1":
-            self.state.education_path = "Four-year college"
-            self.state.education_debt = 40000  # Average student loan debt
-            self.state.cash -= 2000  # Initial costs
-            print(f"\nYou've chosen to attend a four-year university!")
-            print("This will take 4 years and cost about $40,000 in student loans.")
-            print("But you'll have access to higher-paying careers afterward.")
-            
-        elif choice == "2":
-            self.state.education_path = "Community college/Trade school"
-            self.state.education_debt = 15000  # Lower debt
-            self.state.cash -= 1000
-            print(f"\nYou've chosen community college or trade school!")
-            print("This will take 2 years and cost about $15,000.")
-            print("You'll learn practical skills and enter the workforce sooner.")
-            
-        elif choice == "3":
-            self.state.education_path = "High school diploma"
-            self.state.monthly_income = 2400  # Entry-level job
-            print(f"\nYou've chosen to start working right away!")
-            print("You'll begin earning $2,400/month at an entry-level job.")
-            print("No debt, but potentially limited career growth.")
-            
-        elif choice == "4":
-            self.state.education_path = "Military service"
-            self.state.monthly_income = 2200  # Military pay
-            print(f"\nYou've enlisted in the military!")
-            print("You'll earn $2,200/month plus benefits and training.")
-            print("The military will pay for your education afterward.")
-            
-        elif choice == "5":
-            self.state.education_path = "Entrepreneur"
-            self.state.cash -= 5000  # Startup costs
-            self.state.monthly_income = 1500  # Variable income
-            print(f"\nYou've decided to start your own business!")
-            print("You've invested $5,000 of your savings.")
-            print("Income is unpredictable but has unlimited potential!")
+        education = EDUCATION_CHOICES[choice]
+        self.state.education_path = education.path
+        self.state.education_debt = education.debt
+        self.state.cash -= education.upfront_cost
+        self.state.monthly_income = education.monthly_income
+        print("\n".join(education.lines))
         
         # Continue to first month simulation
-        self.simulate_month()
+        self.run_months()
     
     def simulate_month(self):
         """Simulate one month of financial decisions"""
@@ -297,11 +373,11 @@ class GameEngine:
             self.monthly_budgeting()
         
         # Random events (10% chance)
-        if random.random() < 0.1:
+        if _random() < RANDOM_EVENT_CHANCE:
             self.random_event()
         
         # Mini-games (15% chance)
-        if random.random() < 0.15:
+        if _random() < MINIGAME_CHANCE:
             self.play_random_minigame()
         
         # Update cash based on cash flow
@@ -310,34 +386,38 @@ class GameEngine:
         
         # Check for debt payments
         if self.state.education_debt > 0:
-            self.state.education_debt += self.state.education_debt * 0.004  # 4.8% annual interest
+            self.state.education_debt *= DEBT_MONTHLY_FACTOR
         
         # Age the player
         if self.state.game_month % 12 == 0:
             self.state.player_age += 1
-        
-        # Continue or end game
-        if self.state.game_month < 12:  # Play for 1 year in this demo
+    
+    def run_months(self, max_months: int = 12):
+        """Play months until max_months is reached or the player stops, then end the game"""
+        while True:
+            self.simulate_month()
+            
+            # Continue or end game
+            if self.state.game_month >= max_months:  # Play for 1 year in this demo
+                break
             continue_choice = self.get_player_input(
                 "\nContinue to next month? (y/n): ", ["y", "n", "yes", "no"]
             )
-            if continue_choice.lower() in ["y", "yes"]:
-                self.simulate_month()
-            else:
-                self.end_game()
-        else:
-            self.end_game()
+            if continue_choice.lower() not in ["y", "yes"]:
+                break
+        
+        self.end_game()
     
     def display_financial_status(self):
         """Display current financial status"""
-        print(f"Age: {self.state.player_age}")
-        print(f"Cash: ${self.state.cash:,.2f}")
-        print(f"Monthly Income: ${self.state.monthly_income:,.2f}")
-        if self.state.education_debt > 0:
-            print(f"Student Debt: ${self.state.education_debt:,.2f}")
-        print(f"Net Worth: ${self.state.get_net_worth():,.2f}")
-        print(f"Credit Score: {self.state.credit_score}")
-        print()
+        state = self.state
+        debt_line = f"Student Debt: ${state.education_debt:,.2f}\n" if state.education_debt > 0 else ""
+        print(f"Age: {state.player_age}\n"
+              f"Cash: ${state.cash:,.2f}\n"
+              f"Monthly Income: ${state.monthly_income:,.2f}\n"
+              f"{debt_line}"
+              f"Net Worth: ${state.get_net_worth():,.2f}\n"
+              f"Credit Score: {state.credit_score}\n")
     
     def monthly_budgeting(self):
         """Handle monthly budgeting decisions"""
@@ -351,20 +431,18 @@ class GameEngine:
         print("First, let's handle your essential expenses:")
         
         # Housing
-        if self.state.education_path in ["Four-year college", "Community college/Trade school"]:
+        if self.state.education_path in STUDENT_PATHS:
             housing_cost = 800  # Dorm/shared apartment
             print(f"Housing (dorm/shared apartment): ${housing_cost:,.2f}")
         else:
             housing_cost = 600  # Shared living situation
             print(f"Housing (shared apartment): ${housing_cost:,.2f}")
         
-        self.state.monthly_expenses["housing"] = housing_cost
         remaining_income -= housing_cost
         
         # Food
         food_cost = 300
         print(f"Food: ${food_cost:,.2f}")
-        self.state.monthly_expenses["food"] = food_cost
         remaining_income -= food_cost
         
         # Transportation
@@ -380,7 +458,9 @@ class GameEngine:
             transport_cost = 200
             print("You chose to have a car - more expensive but convenient!")
         
-        self.state.monthly_expenses["transportation"] = transport_cost
+        self.state.set_expenses({
+            "housing": housing_cost, "food": food_cost, "transportation": transport_cost
+        })
         remaining_income -= transport_cost
         
         print(f"\nRemaining income for discretionary spending: ${remaining_income:,.2f}")
@@ -396,76 +476,49 @@ class GameEngine:
             choice = self.get_player_input("Choose allocation method (1-4): ", ["1", "2", "3", "4"])
             
             if choice == "1":
-                self.state.monthly_expenses["entertainment"] = remaining_income
+                self.state.set_expense("entertainment", remaining_income)
                 self.state.wellbeing_score += 5
                 print("You spent it all on fun! Your happiness increased but no savings.")
                 
             elif choice == "2":
-                self.state.monthly_expenses["savings"] = remaining_income
+                self.state.set_expense("savings", remaining_income)
                 self.state.savings_account += remaining_income
                 print("Smart! You saved all your extra money.")
                 
             elif choice == "3" and self.state.education_debt > 0:
-                self.state.monthly_expenses["debt_payments"] = remaining_income
+                self.state.set_expense("debt_payments", remaining_income)
                 self.state.education_debt -= remaining_income
                 print("Excellent! You made extra payments on your debt.")
                 
             elif choice == "4":
-                entertainment = remaining_income * 0.5
+                state = self.state
                 savings = remaining_income * 0.3
-                debt_payment = remaining_income * 0.2
+                split = {"entertainment": remaining_income * 0.5, "savings": savings}
+                state.savings_account += savings
                 
-                self.state.monthly_expenses["entertainment"] = entertainment
-                self.state.monthly_expenses["savings"] = savings
-                self.state.savings_account += savings
+                if state.education_debt > 0:
+                    debt_payment = remaining_income * 0.2
+                    split["debt_payments"] = debt_payment
+                    state.education_debt -= debt_payment
                 
-                if self.state.education_debt > 0:
-                    self.state.monthly_expenses["debt_payments"] = debt_payment
-                    self.state.education_debt -= debt_payment
+                state.set_expenses(split)
                 
                 print("Balanced approach! You split your money wisely.")
     
     def random_event(self):
         """Generate a random life event"""
-        events = [
-            {
-                "name": "Car Repair",
-                "description": "Your car broke down and needs $500 in repairs.",
-                "cost": 500,
-                "wellbeing_impact": -5
-            },
-            {
-                "name": "Work Bonus",
-                "description": "Great job! You received a $300 bonus at work.",
-                "cost": -300,
-                "wellbeing_impact": 10
-            },
-            {
-                "name": "Medical Bill",
-                "description": "You had to visit the doctor. Bill: $200.",
-                "cost": 200,
-                "wellbeing_impact": -3
-            },
-            {
-                "name": "Tax Refund",
-                "description": "You got a tax refund of $400!",
-                "cost": -400,
-                "wellbeing_impact": 5
-            }
-        ]
-        
-        event = random.choice(events)
+        event = random.choice(LIFE_EVENTS)
         
-        print(f"\n🎲 RANDOM EVENT: {event['name']}")
-        print(f"   {event['description']}")
+        print(f"\n🎲 RANDOM EVENT: {event.name}")
+        print(f"   {event.description}")
         
-        self.state.cash -= event['cost']
-        self.state.wellbeing_score += event['wellbeing_impact']
+        self.state.cash -= event.cost
+        self.state.wellbeing_score += event.wellbeing_impact
         
-        if event['cost'] > 0:
-            print(f"   This cost you ${event['cost']:,.2f}")
+        if event.cost > 0:
+            print(f"   This cost you ${event.cost:,.2f}")
         else:
-            print(f"   You gained ${abs(event['cost']):,.2f}")
+            print(f"   You gained ${abs(event.cost):,.2f}")
     
     def play_random_minigame(self):
         """Play a random mini-game appropriate to player's situation"""
@@ -485,9 +538,11 @@ class GameEngine:
             return
         
         result = None
+        game = self._minigames.get(game_type)
+        if game is None:
+            game = self._minigames[game_type] = MINIGAME_CLASSES[game_type]()
         
         if game_type == "comparison_shopping":
-            game = ComparisonShoppingGame()
             budget = min(self.state.cash * 0.3, 1000)  # Use up to 30% of cash or $1000
             result = game.play(budget)
             
@@ -496,7 +551,6 @@ class GameEngine:
                 self.state.wellbeing_score += result["wellbeing_bonus"]
         
         elif game_type == "budget_allocation":
-            game = BudgetAllocationGame()
             result = game.play(self.state.monthly_income)
             
             if result["success"]:
@@ -505,7 +559,6 @@ class GameEngine:
                 print("💡 You practiced budgeting skills!")
         
         elif game_type == "investment_simulation":
-            game = InvestmentSimulationGame()
             investment_amount = min(self.state.cash * 0.2, 2000)  # Use up to 20% of cash or $2000
             
             if investment_amount < 500:
@@ -517,7 +570,7 @@ class GameEngine:
             if result["success"]:
                 # For simulation purposes, just apply a small immediate benefit
                 self.state.cash -= investment_amount
-                self.state.investments["index_funds"] += investment_amount
+                self.state.add_investment("index_funds", investment_amount)
                 self.state.wellbeing_score += result["wellbeing_bonus"]
                 print("💡 You learned about investing and started building wealth!")
         
@@ -533,15 +586,14 @@ class GameEngine:
     def save_game(self, filename: Optional[str] = None):
         """Save the current game state"""
         if filename is None:
-            filename = f"{self.state.player_name}_save.json"
+            filename = f"{self.state.player_name}_save.json.gz"
         
         filepath = os.path.join(self.save_directory, filename)
         
         self.state.save_date = datetime.now().isoformat()
         
         try:
-            with open(filepath, 'w') as f:
-                json.dump(self.state.to_dict(), f, indent=2)
+            write_json_file(filepath, self.state.to_dict())
             print(f"Game saved as {filename}")
             return True
         except Exception as e:
@@ -550,7 +602,9 @@ class GameEngine:
     
     def load_game(self) -> bool:
         """Load a saved game"""
-        save_files = [f for f in os.listdir(self.save_directory) if f.endswith('.json')]
+        with os.scandir(self.save_directory) as entries:
+            save_files = sorted(entry.name for entry in entries
+                                if entry.name.endswith(SAVE_FILE_EXTENSIONS) and entry.is_file())
         
         if not save_files:
             print("No saved games found.")
@@ -565,8 +619,7 @@ class GameEngine:
             if 0 <= choice < len(save_files):
                 filepath = os.path.join(self.save_directory, save_files[choice])
                 
-                with open(filepath, 'r') as f:
-                    save_data = json.load(f)
+                save_data = read_json_file(filepath)
                 
                 self.state.from_dict(save_data)
                 print(f"Game loaded: {self.state.player_name}")
@@ -574,35 +627,40 @@ class GameEngine:
             else:
                 print("Invalid choice.")
                 return False
-        except (ValueError, FileNotFoundError, json.JSONDecodeError) as e:
+        except JSON_FILE_ERRORS as e:
             print(f"Error loading game: {e}")
             return False
     
     def end_game(self):
         """End the game and show final results"""
-        print("\n" + "=" * 60)
-        print("GAME OVER - YOUR FINANCIAL JOURNEY SUMMARY")
-        print("=" * 60)
-        print()
-        print(f"Player: {self.state.player_name}")
-        print(f"Age: {self.state.player_age}")
-        print(f"Months Played: {self.state.game_month}")
-        print(f"Education Path: {self.state.education_path}")
-        print()
-        print("FINAL FINANCIAL STATUS:")
-        print(f"Cash: ${self.state.cash:,.2f}")
-        print(f"Savings: ${self.state.savings_account:,.2f}")
-        if self.state.education_debt > 0:
-            print(f"Student Debt: ${self.state.education_debt:,.2f}")
-        print(f"Net Worth: ${self.state.get_net_worth():,.2f}")
-        print(f"Credit Score: {self.state.credit_score}")
-        print(f"Well-being Score: {self.state.wellbeing_score}/100")
-        print()
-        print("LIFE GOALS:")
-        for goal in self.state.life_goals:
-            status = "✓" if goal in self.state.goals_completed else "○"
-            print(f"  {status} {goal}")
-        print()
+        state = self.state
+        lines = [
+            "\n" + "=" * 60,
+            "GAME OVER - YOUR FINANCIAL JOURNEY SUMMARY",
+            "=" * 60,
+            "",
+            f"Player: {state.player_name}",
+            f"Age: {state.player_age}",
+            f"Months Played: {state.game_month}",
+            f"Education Path: {state.education_path}",
+            "",
+            "FINAL FINANCIAL STATUS:",
+            f"Cash: ${state.cash:,.2f}",
+            f"Savings: ${state.savings_account:,.2f}",
+        ]
+        if state.education_debt > 0:
+            lines.append(f"Student Debt: ${state.education_debt:,.2f}")
+        lines += [
+            f"Net Worth: ${state.get_net_worth():,.2f}",
+            f"Credit Score: {state.credit_score}",
+            f"Well-being Score: {state.wellbeing_score}/100",
+            "",
+            "LIFE GOALS:",
+        ]
+        lines.extend(f"  {'✓' if goal in state.goals_completed else '○'} {goal}"
+                     for goal in state.life_goals)
+        lines.append("")
+        print("\n".join(lines))
         
         # Offer to save
         save_choice = self.get_player_input("Save this game? (y/n): ", ["y", "n", "yes", "no"])
@@ -623,7 +681,7 @@ class GameEngine:
                 self.new_game()
             elif choice == "2":
                 if self.load_game():
-                    self.simulate_month()
+                    self.run_months()
             elif choice == "3":
                 print("Thanks for playing ChoiceCents!")
                 self.running = False
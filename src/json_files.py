@@ -0,0 +1,42 @@
+"""
+JSON File I/O for ChoiceCents
+Save files and data files shared by both game engines
+"""
+
+import gzip
+import json
+import os
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Union
+
+# Save formats load_game recognizes: compressed and plain JSON
+SAVE_FILE_EXTENSIONS = (".json.gz", ".json")
+
+# Errors read_json_file raises for missing, unreadable, truncated or corrupt files
+JSON_FILE_ERRORS = (OSError, ValueError, EOFError, zlib.error)
+
+
+def write_json_file(filepath: Union[str, Path], data: Dict[str, Any]):
+    """Write data as JSON, gzip-compressed when the filename ends in .gz"""
+    compressed = os.fspath(filepath).endswith(".gz")
+    # Encode up front so the file gets one write instead of one per JSON token
+    if compressed:
+        payload = json.dumps(data, separators=(",", ":")).encode("utf-8")
+    else:
+        payload = json.dumps(data, indent=2).encode("utf-8")
+    
+    if compressed:
+        with gzip.open(filepath, 'wb', compresslevel=3) as f:
+            f.write(payload)
+    else:
+        with open(filepath, 'wb') as f:
+            f.write(payload)
+
+
+def read_json_file(filepath: Union[str, Path]) -> Dict[str, Any]:
+    """Read a JSON file, or a gzip-compressed one written by write_json_file"""
+    opener = gzip.open if os.fspath(filepath).endswith(".gz") else open
+    with opener(filepath, 'rb') as f:
+        payload = f.read()
+    return json.loads(payload)
@@ -4,6 +4,7 @@ Educational mini-games to teach specific financial concepts
 """
 
 import random
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
 
 class ComparisonShoppingGame:
@@ -27,11 +28,17 @@ class ComparisonShoppingGame:
                 {"name": "New Car", "price": 25000, "quality": 9, "mpg": 32},
             ]
         }
+        
+        # Quality per thousand dollars, fixed per product
+        for products in self.products.values():
+            for product in products:
+                product["value_score"] = product["quality"] / (product["price"] / 1000)
+        self.categories = tuple(self.products)
     
     def play(self, budget: float, category: Optional[str] = None) -> Dict:
         """Play the comparison shopping mini-game"""
         if category is None:
-            category = random.choice(list(self.products.keys()))
+            category = random.choice(self.categories)
         
         print(f"\n🛍️  COMPARISON SHOPPING MINI-GAME")
         print(f"Category: {category.title()}")
@@ -74,9 +81,7 @@ class ComparisonShoppingGame:
                 print("Please enter a number.")
         
         chosen_product = affordable_products[choice]
-        
-        # Calculate value score (quality per dollar)
-        value_score = chosen_product["quality"] / (chosen_product["price"] / 1000)
+        value_score = chosen_product["value_score"]
         
         print(f"\nYou chose: {chosen_product['name']}")
         print(f"Cost: ${chosen_product['price']:,}")
@@ -226,6 +231,13 @@ class InvestmentSimulationGame:
             "index": {"name": "Index Funds", "return": 0.07, "risk": 0.15},
             "stocks": {"name": "Individual Stocks", "return": 0.08, "risk": 0.25},
         }
+        
+        # Growth factor over the 10-year horizon and display risk level, fixed per option
+        for option in self.investment_options.values():
+            option["compound_10y"] = (1 + option["return"]) ** 10
+            option["risk_label"] = "Low" if option["risk"] < 0.1 else "Medium" if option["risk"] < 0.2 else "High"
+        # (key, option) pairs in menu order; menu number N picks entry N - 1
+        self.option_items = tuple(self.investment_options.items())
     
     def play(self, investment_amount: float) -> Dict:
         """Play the investment simulation mini-game"""
@@ -234,11 +246,11 @@ class InvestmentSimulationGame:
         print("=" * 50)
         
         print("Investment Options (10-year simulation):")
-        for key, option in self.investment_options.items():
-            expected_return = investment_amount * (1 + option["return"]) ** 10
-            print(f"{len(self.investment_options) - list(self.investment_options.keys()).index(key)}. {option['name']}")
+        for number, (key, option) in enumerate(self.option_items, 1):
+            expected_return = investment_amount * option["compound_10y"]
+            print(f"{number}. {option['name']}")
             print(f"   Expected annual return: {option['return']*100:.1f}%")
-            print(f"   Risk level: {'Low' if option['risk'] < 0.1 else 'Medium' if option['risk'] < 0.2 else 'High'}")
+            print(f"   Risk level: {option['risk_label']}")
             print(f"   Expected value after 10 years: ${expected_return:,.2f}")
             print()
         
@@ -251,15 +263,14 @@ class InvestmentSimulationGame:
         while True:
             try:
                 choice = int(input("Which investment would you choose? (1-4): ")) - 1
-                if 0 <= choice < len(self.investment_options):
+                if 0 <= choice < len(self.option_items):
                     break
                 else:
                     print("Please enter 1, 2, 3, or 4.")
             except ValueError:
                 print("Please enter a number.")
         
-        chosen_key = list(self.investment_options.keys())[choice]
-        chosen_option = self.investment_options[chosen_key]
+        chosen_key, chosen_option = self.option_items[choice]
         
         # Simulate 10 years with random variations
         final_amount = investment_amount
@@ -309,17 +320,24 @@ class InvestmentSimulationGame:
         }
 
 
-def get_random_minigame(player_cash: float, monthly_income: float) -> Optional[str]:
-    """Select an appropriate mini-game based on player's financial situation"""
+@lru_cache(maxsize=None)
+def _eligible_minigames(can_shop: bool, has_income: bool, can_invest: bool) -> Tuple[str, ...]:
+    """Mini-games open to a player, for each combination of the eligibility thresholds"""
     games = []
     
-    if player_cash >= 500:
+    if can_shop:
         games.append("comparison_shopping")
     
-    if monthly_income > 0:
+    if has_income:
         games.append("budget_allocation")
     
-    if player_cash >= 1000:
+    if can_invest:
         games.append("investment_simulation")
     
-    return random.choice(games) if games else None
\ No newline at end of file
+    return tuple(games)
+
+
+def get_random_minigame(player_cash: float, monthly_income: float) -> Optional[str]:
+    """Select an appropriate mini-game based on player's financial situation"""
+    games = _eligible_minigames(player_cash >= 500, monthly_income > 0, player_cash >= 1000)
+    return random.choice(games) if games else None
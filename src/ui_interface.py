@@ -5,8 +5,10 @@ between console interface and GUI interface in the future.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any, Union
+from bisect import bisect_right
+from typing import List, Optional, Dict, Any, Tuple, Union
 import sys
+import textwrap
 
 class UserInterface(ABC):
     """Abstract base class for user interfaces"""
@@ -16,6 +18,11 @@ class UserInterface(ABC):
         """Display text to the user"""
         pass
     
+    def display_text_batch(self, lines: List[Tuple[str, str]]):
+        """Display several (text, style) lines; interfaces may override to write them at once"""
+        for text, style in lines:
+            self.display_text(text, style)
+    
     @abstractmethod
     def display_header(self, text: str):
         """Display a header/title"""
@@ -65,23 +72,42 @@ class UserInterface(ABC):
 class ConsoleInterface(UserInterface):
     """Console-based user interface implementation"""
     
+    # ANSI escape opening each style display_text understands; other styles print plain
+    _STYLE_PREFIXES = {
+        "bold": "\033[1m",
+        "success": "\033[92m",  # Green
+        "warning": "\033[93m",  # Yellow
+        "error": "\033[91m",    # Red
+        "info": "\033[94m",     # Blue
+    }
+    
+    # Score colors below, between and above the thresholds
+    _SCORE_COLORS = ("warning", "normal", "success")
+    _CREDIT_THRESHOLDS = (650, 750)
+    _WELLBEING_THRESHOLDS = (40, 70)
+    
+    # Progress bar cells, sliced rather than rebuilt on every draw
+    _BAR_LENGTH = 30
+    _BAR_FULL = "█" * _BAR_LENGTH
+    _BAR_EMPTY = "░" * _BAR_LENGTH
+    
     def __init__(self):
         self.width = 60
     
     def display_text(self, text: str, style: str = "normal"):
         """Display text to console with optional styling"""
-        if style == "bold":
-            print(f"\033[1m{text}\033[0m")
-        elif style == "success":
-            print(f"\033[92m{text}\033[0m")  # Green
-        elif style == "warning":
-            print(f"\033[93m{text}\033[0m")  # Yellow
-        elif style == "error":
-            print(f"\033[91m{text}\033[0m")  # Red
-        elif style == "info":
-            print(f"\033[94m{text}\033[0m")  # Blue
-        else:
-            print(text)
+        prefix = self._STYLE_PREFIXES.get(style)
+        print(text if prefix is None else f"{prefix}{text}\033[0m")
+    
+    def display_text_batch(self, lines: List[Tuple[str, str]]):
+        """Display several (text, style) lines with a single write"""
+        if not lines:
+            return
+        prefixes = self._STYLE_PREFIXES
+        sys.stdout.write("\n".join(
+            f"{prefixes[style]}{text}\033[0m" if style in prefixes else text
+            for text, style in lines
+        ) + "\n")
     
     def display_header(self, text: str):
         """Display a formatted header"""
@@ -159,52 +185,44 @@ class ConsoleInterface(UserInterface):
     
     def display_financial_status(self, status: Dict[str, Any]):
         """Display formatted financial status"""
-        print()
-        self.display_header("FINANCIAL STATUS")
+        separator = ("=" * self.width, "normal")
+        lines = [("", "normal"), separator, ("  FINANCIAL STATUS", "bold"), separator]
         
         # Basic info
-        print(f"Age: {status.get('age', 'N/A')}")
-        print(f"Month: {status.get('month', 'N/A')}")
-        print()
+        lines.append((f"Age: {status.get('age', 'N/A')}", "normal"))
+        lines.append((f"Month: {status.get('month', 'N/A')}", "normal"))
+        lines.append(("", "normal"))
         
         # Financial details
         cash = status.get('cash', 0)
-        print(f"Cash: ${cash:,.2f}")
+        lines.append((f"Cash: ${cash:,.2f}", "normal"))
         
         income = status.get('monthly_income', 0)
         if income > 0:
-            print(f"Monthly Income: ${income:,.2f}")
+            lines.append((f"Monthly Income: ${income:,.2f}", "normal"))
         
         debt = status.get('education_debt', 0)
         if debt > 0:
-            self.display_text(f"Student Debt: ${debt:,.2f}", "warning")
+            lines.append((f"Student Debt: ${debt:,.2f}", "warning"))
         
         savings = status.get('savings_account', 0)
         if savings > 0:
-            self.display_text(f"Savings: ${savings:,.2f}", "success")
+            lines.append((f"Savings: ${savings:,.2f}", "success"))
         
         net_worth = status.get('net_worth', 0)
         color = "success" if net_worth >= 0 else "warning"
-        self.display_text(f"Net Worth: ${net_worth:,.2f}", color)
+        lines.append((f"Net Worth: ${net_worth:,.2f}", color))
         
         credit_score = status.get('credit_score', 650)
-        if credit_score >= 750:
-            credit_color = "success"
-        elif credit_score >= 650:
-            credit_color = "normal"
-        else:
-            credit_color = "warning"
-        self.display_text(f"Credit Score: {credit_score}", credit_color)
+        credit_color = self._SCORE_COLORS[bisect_right(self._CREDIT_THRESHOLDS, credit_score)]
+        lines.append((f"Credit Score: {credit_score}", credit_color))
         
         wellbeing = status.get('wellbeing_score', 50)
-        if wellbeing >= 70:
-            wellbeing_color = "success"
-        elif wellbeing >= 40:
-            wellbeing_color = "normal"
-        else:
-            wellbeing_color = "warning"
-        self.display_text(f"Well-being: {wellbeing}/100", wellbeing_color)
-        print()
+        wellbeing_color = self._SCORE_COLORS[bisect_right(self._WELLBEING_THRESHOLDS, wellbeing)]
+        lines.append((f"Well-being: {wellbeing}/100", wellbeing_color))
+        lines.append(("", "normal"))
+        
+        self.display_text_batch(lines)
     
     def display_progress_bar(self, current: int, total: int, label: str = ""):
         """Display a simple text progress bar"""
@@ -212,10 +230,9 @@ class ConsoleInterface(UserInterface):
             return
         
         percentage = (current / total) * 100
-        bar_length = 30
-        filled_length = int(bar_length * current / total)
+        filled_length = min(max(int(self._BAR_LENGTH * current / total), 0), self._BAR_LENGTH)
         
-        bar = "█" * filled_length + "░" * (bar_length - filled_length)
+        bar = self._BAR_FULL[:filled_length] + self._BAR_EMPTY[filled_length:]
         
         if label:
             print(f"{label}: [{bar}] {percentage:.1f}% ({current}/{total})")
@@ -237,23 +254,11 @@ class ConsoleInterface(UserInterface):
     
     def display_story_text(self, text: str, pause_after: bool = True):
         """Display story text with optional pause"""
-        print()
-        # Word wrap for better readability
-        words = text.split()
-        current_line = ""
-        
-        for word in words:
-            if len(current_line + word) <= self.width - 2:
-                current_line += word + " "
-            else:
-                if current_line:
-                    print(current_line.strip())
-                current_line = word + " "
-        
-        if current_line:
-            print(current_line.strip())
-        
-        print()
+        # Word wrap for better readability; runs of whitespace collapse to one space and
+        # over-long words stay whole on their own line
+        wrapped = textwrap.fill(" ".join(text.split()), width=self.width - 2,
+                                break_long_words=False, break_on_hyphens=False)
+        print(f"\n{wrapped}\n" if wrapped else "\n")
         
         if pause_after:
             self.pause_for_input()
@@ -2,29 +2,62 @@
 Simple test to verify ChoiceCents enhanced engine functionality
 """
 
+import gzip
+import io
+import random
 import sys
 import os
+import tempfile
+from contextlib import redirect_stdout
+from functools import lru_cache
+from itertools import islice
 
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
 
-from config import GameConfig, GameText
+# Add src directory to path once
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from config import GameConfig, GameText, Achievements, MONTHLY_DEBT_FACTOR, TRADE_SCHOOL, education_key, part_time_jobs_for
+from json_files import JSON_FILE_ERRORS, read_json_file, write_json_file
 from ui_interface import create_interface
-from enhanced_game_engine import GameState
+from enhanced_game_engine import (
+    AliasTable, EVENT_CONDITION_BITS, EnhancedGameEngine, GameState, _normalize_event_ranges,
+    simulate_passive_months
+)
+
+# Financial status shown by the UI test
+TEST_STATUS = {
+    'age': 18,
+    'month': 1,
+    'cash': 1000.0,
+    'monthly_income': 0,
+    'education_debt': 0,
+    'savings_account': 0,
+    'net_worth': 1000.0,
+    'credit_score': 650,
+    'wellbeing_score': 50
+}
+
+@lru_cache(maxsize=None)
+def console_ui():
+    """Console interface shared by the tests"""
+    return create_interface("console")
 
 def test_config():
     """Test configuration system"""
-    print("Testing Configuration...")
-    print(f"Game Title: {GameConfig.TITLE}")
-    print(f"Version: {GameConfig.VERSION}")
-    print(f"Starting Cash: ${GameConfig.STARTING_CASH}")
-    print(f"Config Valid: {GameConfig.validate_config()}")
-    print()
+    sys.stdout.write(
+        "Testing Configuration...\n"
+        f"Game Title: {GameConfig.TITLE}\n"
+        f"Version: {GameConfig.VERSION}\n"
+        f"Starting Cash: ${GameConfig.STARTING_CASH}\n"
+        f"Config Valid: {GameConfig.validate_config()}\n\n"
+    )
 
 def test_ui():
     """Test UI interface"""
     print("Testing UI Interface...")
-    ui = create_interface("console")
+    ui = console_ui()
     
     ui.display_text("This is a test message", "normal")
     ui.display_text("This is a success message", "success")
@@ -34,19 +67,7 @@ def test_ui():
     ui.display_separator()
     
     # Test financial status display
-    test_status = {
-        'age': 18,
-        'month': 1,
-        'cash': 1000.0,
-        'monthly_income': 0,
-        'education_debt': 0,
-        'savings_account': 0,
-        'net_worth': 1000.0,
-        'credit_score': 650,
-        'wellbeing_score': 50
-    }
-    
-    ui.display_financial_status(test_status)
+    ui.display_financial_status(TEST_STATUS)
     print()
 
 def test_game_state():
@@ -54,58 +75,248 @@ def test_game_state():
     print("Testing Game State...")
     state = GameState()
     
-    print(f"Player starts with ${state.cash}")
-    print(f"Net worth: ${state.get_net_worth()}")
-    print(f"Monthly cash flow: ${state.get_monthly_cash_flow()}")
-    
-    # Test new enhanced attributes
-    print(f"Vehicle: {state.vehicle}")
-    print(f"Vehicle condition: {state.vehicle_condition}")
-    print(f"Part-time job: {state.part_time_job}")
-    print(f"Additional debt: {state.debt}")
-    print(f"Career started: {state.career_started}")
+    lines = [
+        f"Player starts with ${state.cash}",
+        f"Net worth: ${state.get_net_worth()}",
+        f"Monthly cash flow: ${state.get_monthly_cash_flow()}",
+        # Test new enhanced attributes
+        f"Vehicle: {state.vehicle}",
+        f"Vehicle condition: {state.vehicle_condition}",
+        f"Part-time job: {state.part_time_job}",
+        f"Additional debt: {state.debt}",
+        f"Career started: {state.career_started}",
+    ]
     
     # Test achievements
     state.monthly_income = 2000
     new_achievements = state.check_achievements()
-    print(f"New achievements: {new_achievements}")
-    print()
+    lines.append(f"New achievements: {new_achievements}")
+    sys.stdout.write("\n".join(lines) + "\n\n")
 
 def test_enhanced_config():
     """Test enhanced configuration features"""
-    print("Testing Enhanced Configuration...")
-    print(f"Simulation length: {GameConfig.SIMULATION_LENGTH_MONTHS} months")
-    print(f"Time skip options: {GameConfig.TIME_SKIP_OPTIONS}")
-    print(f"Vehicle options: {len(GameConfig.VEHICLE_OPTIONS)} available")
-    print(f"Part-time jobs: {len(GameConfig.PART_TIME_JOBS)} available")
-    from config import Achievements, GameText
-    print(f"Education paths: {len(GameText.EDUCATION_PATHS)} available")
-    print(f"Achievements: {len(Achievements.ACHIEVEMENT_LIST)} available")
+    lines = [
+        "Testing Enhanced Configuration...",
+        f"Simulation length: {GameConfig.SIMULATION_LENGTH_MONTHS} months",
+        f"Time skip options: {GameConfig.TIME_SKIP_OPTIONS}",
+        f"Vehicle options: {len(GameConfig.VEHICLE_OPTIONS)} available",
+        f"Part-time jobs: {len(GameConfig.PART_TIME_JOBS)} available",
+        f"Education paths: {len(GameText.EDUCATION_PATHS)} available",
+        f"Achievements: {len(Achievements.ACHIEVEMENT_LIST)} available",
+    ]
     
     # Show some examples
-    print("\nSample Vehicle Options:")
-    for vehicle_id, vehicle in list(GameConfig.VEHICLE_OPTIONS.items())[:3]:
-        print(f"  - {vehicle['name']}: ${vehicle['purchase_cost']:,} (${vehicle['monthly_cost']}/mo)")
+    lines.append("\nSample Vehicle Options:")
+    for vehicle_id, vehicle in islice(GameConfig.VEHICLE_OPTIONS.items(), 3):
+        lines.append(f"  - {vehicle['name']}: ${vehicle['purchase_cost']:,} (${vehicle['monthly_cost']}/mo)")
+    
+    lines.append("\nSample Part-time Jobs:")
+    for job_id, job in islice(GameConfig.PART_TIME_JOBS.items(), 3):
+        lines.append(f"  - {job['title']}: ${job['hourly_wage']}/hr, {job['max_hours_per_week']}hrs/week")
+    sys.stdout.write("\n".join(lines) + "\n\n")
+
+def test_passive_months():
+    """Test the closed-form time skip against a month-by-month loop"""
+    print("Testing Passive Month Simulation...")
+    for factor in (1.0, MONTHLY_DEBT_FACTOR):
+        for balance, change, months in ((1000.0, 250.0, 6), (-500.0, -120.5, 3), (15000.0, 0.0, 24)):
+            expected = balance
+            for _ in range(months):
+                expected = expected * factor + change
+            result = simulate_passive_months(balance, change, months, factor)
+            assert abs(result - expected) < 1e-6, (balance, change, months, factor, result, expected)
+    print("Closed form matches the monthly loop")
+    print()
+
+def test_education_keys():
+    """Test that menu and job-table labels share education keys"""
+    print("Testing Education Keys...")
+    assert education_key("Trade school") == education_key("Trade School") == TRADE_SCHOOL
+    assert education_key("Four-year university (Public)") == education_key("4-Year University")
+    assert education_key("Four-year university (Private)") == education_key("4-Year University")
+    assert education_key("Community college") == education_key("Community College")
+    assert education_key("Unknown path") == "Unknown path"
+    for path in GameText.EDUCATION_PATHS:
+        print(f"  - {path.name} -> {education_key(path.name)}")
+    print()
+
+def test_part_time_job_index():
+    """Test which part-time jobs each education path is offered"""
+    print("Testing Part-time Job Availability...")
+    for path in GameText.EDUCATION_PATHS:
+        key = education_key(path.name)
+        expected = tuple(
+            job_id for job_id, job in GameConfig.PART_TIME_JOBS.items()
+            if not job.get("education_compatible")
+            or any(education_key(label) == key for label in job["education_compatible"])
+        ) if path.allows_part_time else ()
+        assert part_time_jobs_for(path.name) == expected, path.name
+        print(f"  - {path.name}: {', '.join(expected) or 'none'}")
+    assert part_time_jobs_for("Trade school") == ()
+    print()
+
+def test_save_files():
+    """Test save round-trips and damaged save detection"""
+    print("Testing Save Files...")
+    state = GameState()
+    state.player_name = "Tester"
+    state.set_expenses({"housing": 900, "food": 300})
+    state.add_investment("stocks", 250.0)
+    
+    with tempfile.TemporaryDirectory() as save_dir:
+        for filename in ("test_save.json.gz", "test_save.json"):
+            filepath = os.path.join(save_dir, filename)
+            write_json_file(filepath, state.to_dict())
+            loaded = GameState()
+            loaded.from_dict(read_json_file(filepath))
+            assert loaded.to_dict() == state.to_dict(), filename
+            assert loaded.get_monthly_cash_flow() == state.get_monthly_cash_flow()
+            assert loaded.get_net_worth() == state.get_net_worth()
+        
+        # Truncated and corrupted gzip saves must fail with an error load_game catches
+        payload = gzip.compress(b'{"player_name": "Tester"}' * 20)
+        damaged = [payload[:-6]] + [
+            payload[:i] + bytes([payload[i] ^ 0xFF]) + payload[i + 1:] for i in range(10, len(payload) - 8)
+        ]
+        filepath = os.path.join(save_dir, "damaged_save.json.gz")
+        for data in damaged:
+            with open(filepath, "wb") as f:
+                f.write(data)
+            try:
+                read_json_file(filepath)
+            except JSON_FILE_ERRORS:
+                continue
+            raise AssertionError("damaged save was read without an error")
+    print(f"Round-trips OK; {len(damaged)} damaged saves rejected")
+    print()
+
+def test_event_conditions():
+    """Test the event condition bits set for a player"""
+    print("Testing Event Conditions...")
+    engine = EnhancedGameEngine()
+    assert engine.event_condition_mask() == EVENT_CONDITION_BITS["has_credit_card"]
+    
+    state = engine.state
+    state.monthly_income = 2000
+    state.vehicle = "old_car"
+    state.part_time_job = "retail"
+    state.education_path = "Community college"
+    state.set_expense("housing", 650)
+    assert engine.event_condition_mask() == sum(EVENT_CONDITION_BITS.values())
+    
+    state.credit_score = 450
+    state.vehicle = None
+    assert not engine.event_condition_mask() & (EVENT_CONDITION_BITS["has_credit_card"] | EVENT_CONDITION_BITS["owns_car"])
+    print(f"Condition mask: {engine.event_condition_mask():06b}")
+    print()
+
+def test_event_ranges():
+    """Test that event effect ranges are ordered and malformed ones rejected"""
+    print("Testing Event Ranges...")
+    event = {"name": "Windfall", "cash_impact": [-200, -500], "salary_increase": [0.05, 0.1]}
+    normalized = _normalize_event_ranges(event)
+    assert normalized["cash_impact"] == (-500, -200)
+    assert normalized["salary_increase"] == (0.05, 0.1)
+    
+    for bad_range in ([100], [100, 200, 300], ["100", 200], [None, 5], 100):
+        assert _normalize_event_ranges({"name": "Broken", "cash_impact": bad_range}) is None, bad_range
+    print("Malformed ranges rejected")
+    print()
+
+def test_alias_table():
+    """Test weighted sampling frequencies"""
+    print("Testing Alias Table Sampling...")
+    weights = {"a": 0.5, "b": 0.3, "c": 0.15, "d": 0.05}
+    table = AliasTable(weights, weights.values())
+    
+    saved_state = random.getstate()
+    random.seed(1234)
+    draws = 50000
+    counts = dict.fromkeys(weights, 0)
+    for _ in range(draws):
+        counts[table.sample()] += 1
+    random.setstate(saved_state)
+    
+    for item, weight in weights.items():
+        assert abs(counts[item] / draws - weight) < 0.01, (item, counts[item] / draws, weight)
+    print(f"Frequencies over {draws} draws: " + ", ".join(
+        f"{item}={counts[item] / draws:.3f}" for item in weights))
+    print()
+
+def test_emergency_fund_achievement():
+    """Test that the emergency fund goal counts living expenses only"""
+    print("Testing Emergency Fund Achievement...")
+    state = GameState()
+    state.set_expenses({"housing": 650, "food": 300, "savings": 400, "debt_payments": 250})
+    assert state.monthly_living_expenses == 950
+    
+    state.savings_account = 950 * 6 - 1
+    assert "emergency_fund_master" not in state.check_achievements()
+    state.savings_account = 950 * 6
+    assert "emergency_fund_master" in state.check_achievements()
+    print(f"Earned with ${state.savings_account:,.0f} saved against ${state.monthly_living_expenses:,.0f}/month")
+    print()
+
+class ScriptedEngine(EnhancedGameEngine):
+    """Engine that only advances the calendar, recording career transitions"""
+    
+    def __init__(self):
+        super().__init__()
+        self.transition_months = []
+    
+    def simulate_month(self):
+        self.state.game_month += 1
+    
+    def time_scaling_decision(self, current_month: int, target_months: int) -> int:
+        return 1
+    
+    def career_transition(self):
+        self.transition_months.append(self.state.game_month)
+
+def test_career_timing():
+    """Test that a student's age follows the game calendar"""
+    print("Testing Career Timing...")
+    engine = ScriptedEngine()
+    engine.state.education_path = "4-Year University"
+    with redirect_stdout(io.StringIO()):
+        engine.enhanced_monthly_simulation()
     
-    print("\nSample Part-time Jobs:")
-    for job_id, job in list(GameConfig.PART_TIME_JOBS.items())[:3]:
-        print(f"  - {job['title']}: ${job['hourly_wage']}/hr, {job['max_hours_per_week']}hrs/week")
+    assert engine.state.game_month >= 15
+    assert not engine.transition_months, engine.transition_months
+    assert engine.state.player_age == GameConfig.STARTING_AGE + (engine.state.game_month - 1) // 12
+    print(f"Age {engine.state.player_age} after {engine.state.game_month} months, no career transition")
     print()
 
 def main():
     """Run all tests"""
-    print("=" * 50)
-    print("ChoiceCents Enhanced Engine Test")
-    print("=" * 50)
-    
-    test_config()
-    test_ui()
-    test_game_state()
-    test_enhanced_config()
-    
-    print("All tests completed!")
-    print("If you see this message, the enhanced engine is ready to run.")
-    print("\nTo play the game, run: python main.py")
+    # Collect the whole report and write it out once, even if a test fails
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            print("=" * 50)
+            print("ChoiceCents Enhanced Engine Test")
+            print("=" * 50)
+            
+            test_config()
+            test_ui()
+            test_game_state()
+            test_enhanced_config()
+            test_passive_months()
+            test_education_keys()
+            test_part_time_job_index()
+            test_save_files()
+            test_event_conditions()
+            test_event_ranges()
+            test_alias_table()
+            test_emergency_fund_achievement()
+            test_career_timing()
+            
+            print("All tests completed!")
+            print("If you see this message, the enhanced engine is ready to run.")
+            print("\nTo play the game, run: python main.py")
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file